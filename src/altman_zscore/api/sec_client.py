@@ -10,8 +10,10 @@ from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .rate_limiter import RateLimitExceeded, RateLimitStrategy, TokenBucket
+from ..utils.io import save_json
 from ..utils.paths import get_output_dir
 from ..utils.error_helpers import AltmanZScoreError
 from ..utils.retry import exponential_retry
@@ -26,6 +28,34 @@ NETWORK_EXCEPTIONS = (
 
 logger = logging.getLogger(__name__)
 
+# SEC EDGAR allows at most 10 requests per second per client. The bucket is shared
+# by every SECClient in the process (and across threads) and runs slightly below
+# the limit so bursts from concurrent tickers never trigger 429 backoff storms.
+SEC_REQUESTS_PER_SECOND = 9
+SEC_MAX_CONNECTIONS = 10
+_SEC_RATE_LIMITER = TokenBucket(
+    rate=SEC_REQUESTS_PER_SECOND, capacity=SEC_REQUESTS_PER_SECOND, strategy=RateLimitStrategy.WAIT
+)
+
+
+@lru_cache(maxsize=None)
+def _get_shared_session(user_agent: str) -> requests.Session:
+    """Return a keep-alive session with a connection pool, shared per User-Agent.
+
+    Args:
+        user_agent (str): User-Agent header value sent with every request.
+
+    Returns:
+        requests.Session: Pooled session reused by all SECClient instances.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=SEC_MAX_CONNECTIONS, pool_maxsize=SEC_MAX_CONNECTIONS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = user_agent
+    session.headers["Accept"] = "application/json"
+    return session
+
 
 class SECError(AltmanZScoreError):
     """Base exception for SEC API errors."""
@@ -65,24 +95,16 @@ class SECClient:
             raise ValueError(
                 "SEC EDGAR User-Agent is required. Set SEC_EDGAR_USER_AGENT or SEC_API_EMAIL in your environment."
             )
-        self.rate_limiter = TokenBucket(
-            rate=self.REQUEST_RATE, capacity=self.REQUEST_RATE * 2, strategy=RateLimitStrategy.WAIT
-        )
+        self.rate_limiter = _SEC_RATE_LIMITER
         self.session = self._create_session()
         self._last_request_time = 0
 
     def _create_session(self) -> requests.Session:
-        """Create and configure requests session."""
-        session = requests.Session()
+        """Return the pooled requests session for this client's User-Agent."""
         if self.user_agent:
-            # Only add headers with non-None values
-            session.headers["User-Agent"] = self.user_agent
-            session.headers["Accept"] = "application/json"
-        else:
-            # Fallback for legacy support
-            session.headers["User-Agent"] = f"altman-zscore-analyzer {self.email}"
-            session.headers["Accept"] = "application/json"
-        return session
+            return _get_shared_session(self.user_agent)
+        # Fallback for legacy support
+        return _get_shared_session(f"altman-zscore-analyzer {self.email}")
 
     def _ensure_rate_limit(self):
         """Ensure we respect SEC EDGAR rate limits."""
@@ -90,7 +112,30 @@ class SECClient:
         time_since_last = current_time - self._last_request_time
         if time_since_last < self.MIN_REQUEST_INTERVAL:
             time.sleep(self.MIN_REQUEST_INTERVAL - time_since_last)
-        self._last_request_time = time.time()    @exponential_retry(
+        self._last_request_time = time.time()
+
+    def get_url(self, url: str, timeout: float = 10.0, **kwargs) -> requests.Response:
+        """
+        GET an absolute SEC URL through the shared rate limiter and pooled session.
+
+        Args:
+            url: Absolute URL (e.g. submissions or archives endpoint)
+            timeout: Request timeout in seconds
+            **kwargs: Additional request parameters
+
+        Returns:
+            Response from SEC
+
+        Raises:
+            SECRateError: If the rate limiter times out
+        """
+        try:
+            self.rate_limiter.acquire(timeout=timeout)
+        except RateLimitExceeded as e:
+            raise SECRateError(f"Rate limit exceeded: {str(e)}")
+        return self.session.get(url, timeout=timeout, **kwargs)
+
+    @exponential_retry(
         max_retries=3,
         base_delay=1.0,
         backoff_factor=2.0,
@@ -163,7 +208,7 @@ class SECClient:
                 "owner": "exclude",
                 "action": "getcompany",
             }
-            response = self.session.get(self.BROWSE_EDGAR_URL, params=search_params)
+            response = self.get_url(self.BROWSE_EDGAR_URL, params=search_params)
             response.raise_for_status()
             content = response.text
 
@@ -232,10 +277,8 @@ class SECClient:
             company_info = response.json()
             company_info["cik"] = padded_cik
             if save_to_file and ticker:
-                import json
                 out_path = get_output_dir("company_info.json", ticker=ticker)
-                with open(out_path, "w", encoding="utf-8") as f:
-                    json.dump(company_info, f, indent=2, ensure_ascii=False)
+                save_json(company_info, out_path)
             return company_info
 
         except Exception as e:
@@ -2,10 +2,30 @@
 Yahoo Finance client for Altman Z-Score pipeline (MVP scaffold).
 """
 
+import pandas as pd
 import yfinance as yf
+
+from altman_zscore.data_fetching.prices import close_series
 from altman_zscore.utils.paths import get_output_dir
 
 
+def _shares_outstanding(ticker_obj):
+    """
+    Return shares outstanding, preferring fast_info over the much heavier .info payload.
+    Each tier is guarded on its own; returns None if neither yields a truthy value.
+    """
+    try:
+        shares = getattr(getattr(ticker_obj, "fast_info", None), "shares", None)
+    except Exception:
+        shares = None
+    if not shares:
+        try:
+            shares = ticker_obj.info.get("sharesOutstanding")
+        except Exception:
+            shares = None
+    return shares or None
+
+
 class YahooFinanceClient:
     def get_market_cap_on_date(self, ticker, date, span_days=30, save_to_file=False):
         """
@@ -26,15 +46,12 @@ class YahooFinanceClient:
             if not hist.empty:
                 # Find the row closest to the requested date, but prefer the most recent previous trading day if possible
                 hist = hist.sort_index()
-                # Only consider dates <= requested date, if available
-                prior_dates = [d for d in hist.index if d.date() <= date]
-                if prior_dates:
-                    closest_idx = max(prior_dates)
-                else:
-                    # If no prior dates, use the closest available
-                    closest_idx = min(hist.index, key=lambda d: abs(d.date() - date))
-                shares = ticker_obj.info.get("sharesOutstanding")
-                close = hist.loc[closest_idx]["Close"]
+                # Compare exchange-local calendar days; if every bar is after the date, the first is closest
+                local_days = hist.index.tz_localize(None) if hist.index.tz is not None else hist.index
+                pos = max(int(local_days.normalize().searchsorted(pd.Timestamp(date), side="right")) - 1, 0)
+                closest_idx = hist.index[pos]
+                shares = _shares_outstanding(ticker_obj)
+                close = close_series(hist).iat[pos]
                 if shares and close:
                     actual_date = closest_idx.date()
                     result = {"market_cap": float(shares) * float(close), "actual_date": str(actual_date)}
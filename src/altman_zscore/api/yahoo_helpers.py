@@ -2,12 +2,15 @@
 Centralized yfinance data fetching and validation helpers for DRY compliance.
 """
 import logging
+from datetime import date, timedelta
+from functools import lru_cache
 import pandas as pd
 from typing import Optional, Dict, Any
 import requests.exceptions
 
 import yfinance as yf
 
+from ..utils.cache import FileCache
 from ..utils.retry import exponential_retry
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,21 @@ NETWORK_EXCEPTIONS = (
     requests.exceptions.HTTPError,
 )
 
+# fetch_yfinance_full results rarely change intraday; reuse them from disk for this long
+YF_FULL_CACHE_TTL = timedelta(hours=12)
+
+_yf_full_cache = FileCache("yf_full", YF_FULL_CACHE_TTL)
+
+@lru_cache(maxsize=256)
+def get_yf_ticker(ticker: str) -> yf.Ticker:
+    """
+    Returns a shared yf.Ticker instance for the given ticker.
+
+    yf.Ticker caches its own lazily-fetched properties (e.g. .info), so reusing
+    one instance per ticker avoids repeated network round-trips for the same data.
+    """
+    return yf.Ticker(ticker)
+
 @exponential_retry(
     max_retries=3, 
     base_delay=1.0, 
@@ -34,7 +52,7 @@ def fetch_yfinance_data(ticker: str) -> Optional[Dict[str, Any]]:
     """
     logger = logging.getLogger("altman_zscore.fetch_yfinance_data")
     try:
-        yf_ticker = yf.Ticker(ticker)
+        yf_ticker = get_yf_ticker(ticker)
         info = yf_ticker.info
         bs = yf_ticker.quarterly_balance_sheet
         is_ = yf_ticker.quarterly_financials
@@ -50,21 +68,37 @@ def fetch_yfinance_data(ticker: str) -> Optional[Dict[str, Any]]:
         logger.error(f"Error fetching yfinance data for {ticker}: {e}")
         return None
 
+def fetch_yfinance_full(ticker: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetches yfinance info, balance sheet, income statement, and all major holders, recommendations, prices, dividends, splits.
+    Returns a dict with all objects or None on error.
+
+    Results are kept in the "yf_full" FileCache, keyed by ticker and today's date, for up to
+    YF_FULL_CACHE_TTL; expired entries are purged on first use. Failed fetches are not cached.
+    """
+    key = FileCache.make_key("fetch_yfinance_full", ticker.upper(), date.today().isoformat())
+    result = _yf_full_cache.get(ticker, key)
+    if result is not None:
+        return result
+    result = _fetch_yfinance_full_uncached(ticker)
+    if result is not None:
+        _yf_full_cache.set(ticker, key, result)
+    return result
+
 @exponential_retry(
     max_retries=3, 
     base_delay=1.0, 
     backoff_factor=2.0,
     exceptions=NETWORK_EXCEPTIONS
 )
-def fetch_yfinance_full(ticker: str) -> Optional[Dict[str, Any]]:
+def _fetch_yfinance_full_uncached(ticker: str) -> Optional[Dict[str, Any]]:
     """
-    Fetches yfinance info, balance sheet, income statement, and all major holders, recommendations, prices, dividends, splits.
-    Returns a dict with all objects or None on error.
-    
+    Fetches the full yfinance bundle from the network (see fetch_yfinance_full).
+
     Implements exponential backoff retry for network-related errors.
     """
     try:
-        yf_ticker = yf.Ticker(ticker)
+        yf_ticker = get_yf_ticker(ticker)
         info = yf_ticker.info
         bs = yf_ticker.quarterly_balance_sheet
         is_ = yf_ticker.quarterly_financials
@@ -4,13 +4,16 @@ Executive/officer data fetching and parsing utilities for Altman Z-Score analysi
 Provides functions to fetch and merge company officer/executive data from yfinance and SEC EDGAR, saving results to disk and handling errors robustly.
 """
 import os
-import json
 import logging
 from typing import Any, Dict, Optional
-import yfinance as yf
+from altman_zscore.api.yahoo_helpers import get_yf_ticker
+from altman_zscore.utils.io import save_json
 from altman_zscore.utils.paths import get_output_dir
 from altman_zscore.utils.retry import exponential_retry
 
+# Merged executive data per ticker; only successful results are cached
+_EXECUTIVE_CACHE: Dict[str, Dict[str, Any]] = {}
+
 def fetch_company_officers(ticker: str) -> Optional[Dict[str, Any]]:
     """Fetch company officers information using yfinance.
 
@@ -30,7 +33,7 @@ def fetch_company_officers(ticker: str) -> Optional[Dict[str, Any]]:
     try:
         @exponential_retry(max_retries=3, base_delay=1.0, backoff_factor=2.0)
         def _get_info():
-            stock = yf.Ticker(ticker)
+            stock = get_yf_ticker(ticker)
             return stock.info
         info = _get_info()
 
@@ -60,8 +63,7 @@ def fetch_company_officers(ticker: str) -> Optional[Dict[str, Any]]:
         # Save the data
         output_dir = get_output_dir(ticker)
         officers_file = os.path.join(output_dir, "company_officers.json")
-        with open(officers_file, 'w', encoding='utf-8') as f:
-            json.dump({'officers': formatted_officers}, f, indent=4, ensure_ascii=False)
+        save_json({'officers': formatted_officers}, officers_file)
 
         return {'officers': formatted_officers}
 
@@ -85,15 +87,18 @@ def fetch_executive_data(ticker: str) -> Optional[Dict[str, Any]]:
         - Uses SEC EDGAR DEF 14A filings for additional/historical data.
         - Merges data when available from both sources.
         - Returns None if no data is found from either source.
+        - Successful results are memoized per ticker for the lifetime of the process.
     """
     logger = logging.getLogger("altman_zscore.fetch_executive_data")
+    if ticker in _EXECUTIVE_CACHE:
+        return _EXECUTIVE_CACHE[ticker]
     output_dir = get_output_dir(ticker)
 
     try:
         # 1. First try yfinance
         @exponential_retry(max_retries=3, base_delay=1.0, backoff_factor=2.0)
         def _get_info():
-            stock = yf.Ticker(ticker)
+            stock = get_yf_ticker(ticker)
             return stock.info
         info = _get_info()
         yf_officers = []
@@ -124,9 +129,7 @@ def fetch_executive_data(ticker: str) -> Optional[Dict[str, Any]]:
             if cik:
                 # Get company submissions
                 url = f"{SECClient.SUBMISSIONS_BASE_URL}CIK{cik.zfill(10)}.json"
-                import requests
-                response = requests.get(url, 
-                    headers={'User-Agent': f'altman-zscore-analyzer ({os.getenv("SEC_API_EMAIL")})'})
+                response = client.get_url(url)
                 
                 if response.ok:
                     data = response.json()
@@ -148,8 +151,7 @@ def fetch_executive_data(ticker: str) -> Optional[Dict[str, Any]]:
 
                             # Get the filing content
                             filing_url = f"{SECClient.ARCHIVES_BASE_URL}{cik}/{accession_number}/{primary_doc}"
-                            response = requests.get(filing_url, 
-                                headers={'User-Agent': f'altman-zscore-analyzer ({os.getenv("SEC_API_EMAIL")})'})
+                            response = client.get_url(filing_url, headers={'Accept': 'text/html'})
                             
                             if response.ok:
                                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -246,9 +248,9 @@ def fetch_executive_data(ticker: str) -> Optional[Dict[str, Any]]:
         # Save the combined data
         result = {'officers': all_officers}
         officers_file = os.path.join(output_dir, "company_officers.json")
-        with open(officers_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4, ensure_ascii=False)
+        save_json(result, officers_file)
 
+        _EXECUTIVE_CACHE[ticker] = result
         return result
 
     except Exception as e:
@@ -7,11 +7,14 @@ Provides functions to fetch quarterly financials for a given ticker using SEC ED
 # All imports should be at the top of the file, per Python best practices.
 import decimal
 from decimal import Decimal
+import heapq
 import os
 import sys
+from pathlib import Path
 import logging
 import json
-from typing import Dict, Any, List, Optional, Union, TypedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union, TypedDict
 
 import pandas as pd
 import yfinance as yf
@@ -20,9 +23,10 @@ import numpy as np
 
 from altman_zscore.api.openai_client import AzureOpenAIClient
 from altman_zscore.utils.paths import get_output_dir
+from altman_zscore.utils.io import save_json, save_ndjson
 from altman_zscore.computation.constants import MODEL_FIELDS
 from altman_zscore.data_fetching.executives import fetch_company_officers, fetch_executive_data
-from altman_zscore.data_fetching.financials_core import df_to_dict_str_keys
+from altman_zscore.data_fetching.financials_core import FieldIndex, df_to_dict_str_keys, find_matching_field
 from altman_zscore.utils.retry import exponential_retry
 
 # Network exceptions to retry on
@@ -35,6 +39,98 @@ NETWORK_EXCEPTIONS = (
 from altman_zscore.api.yahoo_helpers import fetch_yfinance_data, fetch_yfinance_full
 from altman_zscore.utils.error_helpers import DataFetchingError, raise_with_context
 
+# Zero value for quarter fields (stored as floats); compared directly, no re-wrapping
+_ZERO = 0.0
+
+# Fields fetch_financials requests per model: the model's fields plus "sales", built once
+_MODEL_FETCH_FIELDS: Dict[str, Tuple[str, ...]] = {
+    model: tuple(fields) + (() if "sales" in fields else ("sales",))
+    for model, fields in MODEL_FIELDS.items()
+}
+
+def _write_output_file(path: Union[str, Path], payload: Any, ticker: str, logger: logging.Logger) -> None:
+    """Write one output file (see _write_output_files); failures are logged, never raised."""
+    try:
+        if isinstance(payload, str):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(payload)
+        else:
+            save_json(payload, path)
+    except Exception as e:
+        logger.warning(f"[{ticker}] Could not save {os.path.basename(path)}: {e}")
+
+def _write_output_files(writes: List[Tuple[Union[str, Path], Any]], ticker: str, logger: logging.Logger) -> None:
+    """Write the collected output files, one after another.
+
+    Args:
+        writes (list): (path, payload) tuples. String payloads are written as-is; anything else is dumped as JSON.
+        ticker (str): Stock ticker symbol (for log context).
+        logger (logging.Logger): Logger used to report failed writes.
+
+    Notes:
+        - Failures are logged as warnings and never abort the remaining writes.
+    """
+    for path, payload in writes:
+        _write_output_file(path, payload, ticker, logger)
+
+def _save_statements_json(statements: Dict[str, Optional[pd.DataFrame]], path: Union[str, Path]) -> None:
+    """Write statement DataFrames as one JSON object using pandas' C serializer.
+
+    Each statement is encoded with ``DataFrame.to_json(orient="columns")``, giving the
+    same {period: {line_item: value}} shape as before without a Python pass over the
+    cells. Period keys keep the str(Timestamp) form ("2024-03-31 00:00:00"); NaN cells
+    become null.
+
+    Args:
+        statements (dict): Statement name -> DataFrame (non-DataFrames are written as {}).
+        path (str): Output file path.
+    """
+    parts = []
+    for name, df in statements.items():
+        if isinstance(df, pd.DataFrame):
+            # orient="columns" needs unique labels; keep the first duplicate as lookups do
+            if not (df.index.is_unique and df.columns.is_unique):
+                df = df.loc[~df.index.duplicated(), ~df.columns.duplicated()]
+            # Stringify the period labels so to_json keeps str(Timestamp) keys instead of ISO/epoch ones
+            body = df.rename(columns=str).to_json(orient="columns")
+        else:
+            body = "{}"
+        parts.append(f"{json.dumps(name)}: {body}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{" + ", ".join(parts) + "}")
+
+def _save_quarters(quarters: List[Dict[str, Any]], output_dir: Path, output_format: str = "json") -> None:
+    """Write processed quarters as a JSON array or, for batch runs, as streamed NDJSON."""
+    if output_format == "ndjson":
+        save_ndjson(quarters, output_dir / "financials_quarterly.ndjson")
+    else:
+        save_json(quarters, output_dir / "financials_quarterly.json")
+
+def _sort_quarters_by_period(quarters: List[Dict[str, Any]], missing_fields_by_quarter: List[List[str]]) -> Tuple[List[Dict[str, Any]], List[List[str]]]:
+    """Sort quarters ascending by period_end, keeping the parallel missing-fields list aligned.
+
+    Args:
+        quarters (list): Quarter dicts with a "period_end" key.
+        missing_fields_by_quarter (list): Missing field names, one list per quarter.
+
+    Returns:
+        tuple: (sorted quarters, matching missing-field lists).
+    """
+    order = sorted(range(len(quarters)), key=lambda i: quarters[i]["period_end"])
+    return [quarters[i] for i in order], [missing_fields_by_quarter[i] for i in order]
+
+def _as_mapping_dict(value) -> Dict[str, Any]:
+    """Return a field_mapping value as a new dict, decoding legacy JSON strings."""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, str) and value:
+        try:
+            decoded = json.loads(value)
+        except ValueError:
+            return {}
+        return decoded if isinstance(decoded, dict) else {}
+    return {}
+
 def merge_quarters_by_period(existing_quarters, new_quarters):
     """Merge quarterly data from different sources by period end date."""
     period_map = {q["period_end"]: q for q in existing_quarters}
@@ -46,11 +142,10 @@ def merge_quarters_by_period(existing_quarters, new_quarters):
             for field, value in new_q.items():
                 if field != "period_end" and value is not None:
                     if field == "field_mapping":
-                        # Merge field mappings
-                        existing_map = json.loads(period_map[period].get("field_mapping", "{}"))
-                        new_map = json.loads(value)
-                        existing_map.update(new_map)
-                        period_map[period]["field_mapping"] = json.dumps(existing_map)
+                        # Merge field mappings (stored as dicts; JSON strings accepted for older data)
+                        existing_map = _as_mapping_dict(period_map[period].get("field_mapping"))
+                        existing_map.update(_as_mapping_dict(value))
+                        period_map[period]["field_mapping"] = existing_map
                     else:
                         period_map[period][field] = value
         else:
@@ -66,13 +161,15 @@ def merge_quarters_by_period(existing_quarters, new_quarters):
     backoff_factor=2.0,
     exceptions=NETWORK_EXCEPTIONS
 )
-def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date: str = None) -> Optional[Dict[str, Any]]:
+def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date: str = None, output_format: str = "json") -> Optional[Dict[str, Any]]:
     """Fetch 12 quarters of real financials for the given ticker using SEC EDGAR (primary) and yfinance (fallback).
 
     Args:
         ticker (str): Stock ticker symbol (e.g., 'AAPL').
         end_date (str): End date for financials (ignored in MVP, uses all available).
         zscore_model (str): Z-Score model name (determines required fields).
+        output_format (str, optional): "json" writes financials_quarterly.json as one array;
+            "ndjson" streams financials_quarterly.ndjson one quarter per line (for batch runs).
 
     Returns:
         dict or None: {"quarters": [dict, ...]} if data found, else None.
@@ -92,10 +189,8 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
         logger.error(f"Invalid Z-Score model {zscore_model}")
         return None
 
-    output_dir = get_output_dir(ticker)
-    fields_to_fetch = list(MODEL_FIELDS[zscore_model]) if zscore_model in MODEL_FIELDS else list(MODEL_FIELDS["original"])
-    if "sales" not in fields_to_fetch:
-        fields_to_fetch.append("sales")
+    output_dir = Path(get_output_dir(ticker=ticker))
+    fields_to_fetch = _MODEL_FETCH_FIELDS[zscore_model]
 
     # --- SEC EDGAR primary ---
     try:
@@ -129,7 +224,7 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
             
             # Use AI to map fields
             client = AzureOpenAIClient()
-            ai_mapping = client.suggest_field_mapping(raw_fields, fields_to_fetch, sample_values)
+            ai_mapping = client.suggest_field_mapping(raw_fields, list(fields_to_fetch), sample_values)
             if not ai_mapping:
                 logger.warning(f"[{ticker}] AI field mapping returned no results.")
         except Exception as e:
@@ -141,24 +236,34 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
                 if isinstance(mapped, dict):
                     direct_mapping[canonical] = mapped.get("FoundField")
                 else:
-                    direct_mapping[canonical] = mapped        # Process each mapped field
+                    direct_mapping[canonical] = mapped
+        # Reverse map (XBRL name -> canonical fields) so each fact is walked once,
+        # even when several canonical fields resolve to the same XBRL concept.
+        xbrl_to_fields: Dict[str, List[str]] = {}
+        sec_fields = FieldIndex(raw_fields)
         for field in fields_to_fetch:
-            raw_field = direct_mapping.get(field)
-            if not raw_field:
-                continue
-            fact = us_gaap_facts.get(raw_field)
-            if not fact:
-                continue
-            for item in fact.get("units", {}).values():
-                for entry in item:
-                    end = entry.get("end")
-                    val = entry.get("val")
-                    if not end or val is None:
-                        continue
-                    if end not in periods:
-                        periods[end] = {}
-                    periods[end][field] = Decimal(str(val))
-                    periods[end]["field_mapping"] = raw_field
+            # Tolerate case differences between the AI-suggested and actual XBRL names
+            raw_field = find_matching_field(direct_mapping.get(field), sec_fields)
+            if raw_field:
+                xbrl_to_fields.setdefault(raw_field, []).append(field)
+        # Flatten every (field, period end, value) fact into rows and pivot once;
+        # 'last' keeps the most recently listed value for a period, as the loop did.
+        rows = [
+            (field, entry["end"], entry["val"])
+            for raw_field, mapped_fields in xbrl_to_fields.items()
+            for unit_entries in (us_gaap_facts.get(raw_field) or {}).get("units", {}).values()
+            for entry in unit_entries
+            if entry.get("end") and entry.get("val") is not None
+            for field in mapped_fields
+        ]
+        if rows:
+            field_to_xbrl = {field: raw_field for raw_field, mapped_fields in xbrl_to_fields.items() for field in mapped_fields}
+            facts_df = pd.DataFrame(rows, columns=["field", "end", "val"])
+            wide = facts_df.pivot_table(index="end", columns="field", values="val", aggfunc="last")
+            for end, row in wide.to_dict(orient="index").items():
+                period_data = {field: float(val) for field, val in row.items() if val == val}
+                period_data["field_mapping"] = {field: field_to_xbrl[field] for field in period_data}
+                periods[end] = period_data
         critical_fields = ["total_assets", "current_assets", "current_liabilities", "retained_earnings"]
         for period_end, data in periods.items():
             missing = [f for f in critical_fields if f not in data or data[f] is None]
@@ -169,7 +274,7 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
             # Fill missing fields with 0 and mark as missing
             for f in fields_to_fetch:
                 if f not in data or data[f] is None:
-                    data[f] = Decimal("0")
+                    data[f] = 0.0
             data["period_end"] = period_end
             # Only include quarters after start_date if specified
             if start_date is None or period_end >= start_date:
@@ -177,16 +282,12 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
                 missing_fields_by_quarter.append(missing)
 
         # Sort quarters by period end date without limiting to last 12
-        quarters = sorted(quarters, key=lambda x: x["period_end"])
+        quarters, missing_fields_by_quarter = _sort_quarters_by_period(quarters, missing_fields_by_quarter)
 
         if quarters:
             # After collecting quarters, check if all non-asset/liability fields are zero
             non_asset_fields = [f for f in fields_to_fetch if f not in ("total_assets", "current_assets", "current_liabilities", "total_liabilities")]
-            all_zero = True
-            for q in quarters:
-                if any(Decimal(str(q.get(f, 0))) != 0 for f in non_asset_fields):
-                    all_zero = False
-                    break
+            all_zero = not any(q.get(f, _ZERO) != _ZERO for q in quarters for f in non_asset_fields)
             if all_zero:
                 logger.error(f"[{ticker}] SEC EDGAR: Only balance sheet data available; all income statement fields are zero. No Z-Score can be computed.")
                 return {
@@ -194,11 +295,7 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
                     "quarters": quarters,
                     "missing_fields_by_quarter": missing_fields_by_quarter
                 }
-            output_dir = get_output_dir(None, ticker=ticker)
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            with open(os.path.join(output_dir, "financials_quarterly.json"), "w", encoding="utf-8") as f:
-                json.dump(quarters, f, indent=2, ensure_ascii=False, default=str)
+            _save_quarters(quarters, output_dir, output_format)
             return {"quarters": quarters, "missing_fields_by_quarter": missing_fields_by_quarter}
         else:
             logger.error(f"[{ticker}] SEC EDGAR: No usable financial data found.")
@@ -213,28 +310,21 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
         bs = yf_data["balance_sheet"] if yf_data else None
         is_ = yf_data["income_statement"] if yf_data else None
         info = yf_data["info"] if yf_data else None
-        raw_data = {
-            "balance_sheet": df_to_dict_str_keys(bs) if isinstance(bs, pd.DataFrame) else {},
-            "income_statement": df_to_dict_str_keys(is_) if isinstance(is_, pd.DataFrame) else {},
-        }
-        with open(os.path.join(output_dir, "financials_raw.json"), "w", encoding="utf-8") as f:
-            json.dump(raw_data, f, indent=4, ensure_ascii=False, default=str)
+        _save_statements_json(
+            {"balance_sheet": bs, "income_statement": is_},
+            output_dir / "financials_raw.json",
+        )
         if not (isinstance(bs, pd.DataFrame) and not bs.empty and isinstance(is_, pd.DataFrame) and not is_.empty):
             logger.warning(f"[{{ticker}}] yfinance: One or both DataFrames are empty. balance_sheet empty: {{bs is not None and bs.empty}}, income_statement empty: {{is_ is not None and is_.empty}}")
         if isinstance(bs, pd.DataFrame) and not bs.empty and isinstance(is_, pd.DataFrame) and not is_.empty:
-            raw_data = {
-                "balance_sheet": df_to_dict_str_keys(bs),
-                "income_statement": df_to_dict_str_keys(is_),
-            }
-            with open(os.path.join(output_dir, "financials_raw.json"), "w", encoding="utf-8") as f:
-                json.dump(raw_data, f, indent=4, ensure_ascii=False, default=str)
             quarters = []
             common_periods = [p for p in bs.columns if p in is_.columns]
             missing_fields_by_quarter = []
             direct_mapping = {}
-            available_bs_keys = set(str(idx) for idx in bs.index)
-            available_is_keys = set(str(idx) for idx in is_.index)
-            all_available_keys = available_bs_keys.union(available_is_keys)
+            # yfinance line-item labels are normally already strings; only coerce when they are not
+            available_bs_keys = set(bs.index) if bs.index.inferred_type == "string" else set(map(str, bs.index))
+            available_is_keys = set(is_.index) if is_.index.inferred_type == "string" else set(map(str, is_.index))
+            all_available_keys = available_bs_keys | available_is_keys
             raw_fields = list(all_available_keys)
             sample_values = {}
             for f in raw_fields:
@@ -259,82 +349,59 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
                                 direct_mapping[field] = mapped
             except Exception as e:
                 logger.warning(f"AI field mapping failed: {e}. Will use only direct mapping.")
+            # Extract both statements once into {row_label: {period: float}} so the
+            # per-quarter loop does plain dict lookups instead of pandas indexing.
+            bs_map = _statement_to_float_map(bs)
+            is_map = _statement_to_float_map(is_)
+            # Resolve each field's source once; the mapping does not change per quarter.
+            # routes[field] = (mapped_field_label, [row dicts]); an INFERRED mapping
+            # routes to two balance-sheet rows whose difference is the value.
+            routes: Dict[str, Tuple[str, List[Dict[Any, float]]]] = {}
+            bs_fields = FieldIndex(bs_map)
+            is_fields = FieldIndex(is_map)
+            for field in fields_to_fetch:
+                raw_field = direct_mapping.get(field)
+                if not raw_field or not isinstance(raw_field, str):
+                    logger.debug(f"No mapping found for {field}")
+                    continue
+                if raw_field.startswith("INFERRED:"):
+                    try:
+                        _, equity_field, paid_in_field = raw_field.split(":")
+                    except ValueError:
+                        logger.warning(f"Malformed inferred mapping for {field}: {raw_field}")
+                        continue
+                    equity_field = find_matching_field(equity_field, bs_fields)
+                    paid_in_field = find_matching_field(paid_in_field, bs_fields)
+                    if equity_field and paid_in_field:
+                        routes[field] = (
+                            f"Inferred from {equity_field} minus {paid_in_field}",
+                            [bs_map[equity_field], bs_map[paid_in_field]],
+                        )
+                    else:
+                        logger.debug(f"Missing required rows for inferred field {field}: {raw_field}")
+                else:
+                    # Tolerate case differences between the AI-suggested and actual row labels
+                    bs_label = find_matching_field(raw_field, bs_fields)
+                    if bs_label:
+                        routes[field] = (bs_label, [bs_map[bs_label]])
+                    else:
+                        is_label = find_matching_field(raw_field, is_fields)
+                        if is_label:
+                            routes[field] = (is_label, [is_map[is_label]])
+            process_quarter = _build_quarter_processor(fields_to_fetch, routes)
             for period in common_periods:
                 try:
                     logger.debug(f"Processing period {period}")
                     q = {}
-                    field_mapping = {}
-                    missing = []
                     if isinstance(period, str):
                         q["period_end"] = period.split()[0]
                     else:
                         q["period_end"] = period.strftime("%Y-%m-%d")
-                    for field in fields_to_fetch:
-                        logger.debug(f"Processing field {field}")
-                        val = None
-                        mapped_field = None
-                        raw_field = direct_mapping.get(field)
-                        logger.debug(f"Direct mapping for {field}: {raw_field}")
-                        if raw_field and isinstance(raw_field, str) and raw_field.startswith("INFERRED:"):
-                            logger.debug(f"Processing inferred field {raw_field}")
-                            _, equity_field, paid_in_field = raw_field.split(":")
-                            try:
-                                logger.debug(f"Checking BS index for fields - equity: {equity_field}, paid_in: {paid_in_field}")
-                                logger.debug(f"Available BS fields: {list(bs.index)}")
-                                equity_val = bs.loc[equity_field, period] if equity_field in bs.index else None
-                                paid_in_val = bs.loc[paid_in_field, period] if paid_in_field in bs.index else None
-                                logger.debug(f"Got raw values - Equity: {equity_val} ({type(equity_val)}), Paid in: {paid_in_val} ({type(paid_in_val)})")
-                                if equity_val is not None and paid_in_val is not None:
-                                    equity_dec = safe_to_decimal(str(equity_val))
-                                    paid_in_dec = safe_to_decimal(str(paid_in_val))
-                                    logger.debug(f"Converted to Decimal - Equity: {equity_dec}, Paid in: {paid_in_dec}")
-                                    if equity_dec is not None and paid_in_dec is not None:
-                                        val = equity_dec - paid_in_dec
-                                        logger.debug(f"Calculated inferred value: {val}")
-                                        mapped_field = f"Inferred from {equity_field} minus {paid_in_field}"
-                                        logger.debug(f"Using inferred retained earnings value: {val}")
-                                        q[field] = val
-                                        field_mapping[field] = mapped_field
-                                        continue
-                                    else:
-                                        logger.warning("Failed to convert equity or paid-in capital to Decimal")
-                                        missing.append(field)
-                                else:
-                                    logger.debug("Missing required values for inference")
-                                    logger.debug(f"Available fields in BS for period {period}: {list(bs.index)}")
-                                    missing.append(field)
-                            except Exception as e:
-                                logger.warning(f"Failed to calculate inferred value for {field}: {e}")
-                                missing.append(field)
-                        else:
-                            logger.debug(f"Normal field processing for {field}")
-                            if raw_field:
-                                mapped_field = raw_field
-                                try:
-                                    if raw_field in bs.index:
-                                        val = safe_to_decimal(bs.loc[raw_field, period])
-                                        logger.debug(f"Got value from balance sheet: {val}")
-                                    elif raw_field in is_.index:
-                                        val = safe_to_decimal(is_.loc[raw_field, period])
-                                        logger.debug(f"Got value from income statement: {val}")
-                                    else:
-                                        val = None
-                                except Exception as e:
-                                    logger.warning(f"Failed to get value for {raw_field}: {e}")
-                                    val = None
-                                    missing.append(field)
-                            else:
-                                logger.debug(f"No mapping found for {field}")
-                                missing.append(field)
-                        if val in [None, 0, Decimal("0")]:
-                            logger.debug(f"Skipping {field} because value is None or 0")
-                            missing.append(field)
-                        else:
-                            logger.debug(f"Adding {field} with value {val}")
-                            q[field] = val
-                            field_mapping[field] = mapped_field
+                    values, field_mapping, missing = process_quarter(period)
+                    q.update(values)
                     if q:
-                        q["field_mapping"] = json.dumps(field_mapping, default=str)
+                        # Kept as a dict; serialized once with the whole quarters list
+                        q["field_mapping"] = field_mapping
                         if start_date is None or q["period_end"] >= start_date:
                             quarters.append(q)
                             missing_fields_by_quarter.append(missing)
@@ -342,14 +409,10 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
                     logger.warning(f"Failed to process period {period}: {e}")
                     continue
             # Sort quarters by period end date without limiting to last 12
-            quarters = sorted(quarters, key=lambda x: x["period_end"])
+            quarters, missing_fields_by_quarter = _sort_quarters_by_period(quarters, missing_fields_by_quarter)
             if quarters:
                 non_asset_fields = [f for f in fields_to_fetch if f not in ("total_assets", "current_assets", "current_liabilities", "total_liabilities")]
-                all_zero = True
-                for q in quarters:
-                    if any(Decimal(str(q.get(f, 0))) != 0 for f in non_asset_fields):
-                        all_zero = False
-                        break
+                all_zero = not any(q.get(f, _ZERO) != _ZERO for q in quarters for f in non_asset_fields)
                 if all_zero:
                     logger.error(f"[{ticker}] yfinance fallback: Only balance sheet data available; all income statement fields are zero. No Z-Score can be computed.")
                     return {
@@ -357,11 +420,7 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
                         "quarters": quarters,
                         "missing_fields_by_quarter": missing_fields_by_quarter
                     }
-                output_dir = get_output_dir(None, ticker=ticker)
-                if not os.path.exists(output_dir):
-                    os.makedirs(output_dir)
-                with open(os.path.join(output_dir, "financials_quarterly.json"), "w", encoding="utf-8") as f:
-                    json.dump(quarters, f, indent=2, ensure_ascii=False, default=str)
+                _save_quarters(quarters, output_dir, output_format)
                 return {"quarters": quarters, "missing_fields_by_quarter": missing_fields_by_quarter}
             else:
                 logger.error(f"[{ticker}] No usable financial data found after processing. Data may be present but missing required fields.")
@@ -374,6 +433,117 @@ def fetch_financials(ticker: str, end_date: str, zscore_model: str, start_date:
     logger.error(f"[{ticker}] No usable financial data found from SEC or Yahoo. Returning empty result.")
     return {"quarters": [], "error": "No usable financial data found from SEC or Yahoo."}
 
+def fetch_financials_batch(
+    tickers: List[str], end_date: str, zscore_model: str, start_date: str = None, max_workers: int = 8,
+    output_format: str = "ndjson",
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Fetch financials for several tickers concurrently.
+
+    Args:
+        tickers (list): Stock ticker symbols.
+        end_date (str): End date for financials (passed through to fetch_financials).
+        zscore_model (str): Z-Score model name (determines required fields).
+        start_date (str, optional): Earliest period end to include.
+        max_workers (int, optional): Thread pool size (default: 8).
+        output_format (str, optional): Quarterly file format per ticker (default: "ndjson").
+
+    Returns:
+        dict: {ticker: fetch_financials result}, None for tickers that raised.
+
+    Notes:
+        - The work is network-bound, so threads overlap well despite the GIL.
+        - SEC EDGAR requests from all workers share SECClient's process-wide rate limiter,
+          so fanning out never exceeds EDGAR's request-rate limit.
+    """
+    logger = logging.getLogger("altman_zscore.fetch_financials_batch")
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    if not tickers:
+        return results
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as executor:
+        futures = {
+            t: executor.submit(fetch_financials, t, end_date, zscore_model, start_date, output_format=output_format)
+            for t in tickers
+        }
+        for ticker, future in futures.items():
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                logger.error(f"[{ticker}] Financials fetch failed: {e}")
+                results[ticker] = None
+    return results
+
+def _build_quarter_processor(
+    fields: Tuple[str, ...], routes: Dict[str, Tuple[str, List[Dict[Any, float]]]]
+) -> Callable[[Any], Tuple[Dict[str, float], Dict[str, str], List[str]]]:
+    """Specialize per-quarter extraction for one ticker's resolved field routes.
+
+    The routes are fixed once the field mapping is known, so route lookups and the
+    direct-vs-inferred dispatch are resolved here, once, into flat step tuples; the
+    returned function then only does the per-period dict reads.
+
+    Args:
+        fields (tuple): Canonical fields to extract, in output order.
+        routes (dict): field -> (mapped label, [row dict] or [equity row, paid-in row]).
+
+    Returns:
+        Callable: process(period) -> (values, field_mapping, missing).
+    """
+    steps = []
+    for field in fields:
+        route = routes.get(field)
+        if route is None:
+            steps.append((field, None, None, None))
+        else:
+            label, rows = route
+            steps.append((field, label, rows[0], rows[1] if len(rows) > 1 else None))
+    steps = tuple(steps)
+
+    def process(period):
+        values: Dict[str, float] = {}
+        field_mapping: Dict[str, str] = {}
+        missing: List[str] = []
+        for field, label, row, subtract_row in steps:
+            val = row.get(period) if row is not None else None
+            if val is not None and subtract_row is not None:
+                paid_in_val = subtract_row.get(period)
+                val = val - paid_in_val if paid_in_val is not None else None
+            # NaN cells were dropped when the row maps were built; a zero result counts as
+            # missing, but only after inference, so a zero paid-in capital still subtracts
+            if val is None or val == _ZERO:
+                missing.append(field)
+            else:
+                values[field] = val
+                field_mapping[field] = label
+        return values, field_mapping, missing
+
+    return process
+
+def _statement_to_float_map(df: pd.DataFrame) -> Dict[str, Dict[Any, float]]:
+    """Convert a yfinance statement DataFrame into nested dicts of floats.
+
+    Args:
+        df (pd.DataFrame): Statement with line items as index and periods as columns.
+
+    Returns:
+        Dict[str, Dict[Any, float]]: {row_label: {period: value}} holding only numeric cells;
+        NaN and unparseable cells are omitted, so a lookup miss means "missing". Zero cells
+        are kept, since they are valid operands of an INFERRED difference.
+        Duplicate row labels keep their first occurrence, matching index lookup order.
+    """
+    # One vectorized numeric coercion and one NaN mask, both evaluated in NumPy
+    numeric = df.apply(pd.to_numeric, errors="coerce")
+    values = numeric.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    periods = list(numeric.columns)
+    result: Dict[str, Dict[Any, float]] = {}
+    for label, row, mask in zip(numeric.index, values, present):
+        key = str(label)
+        if key in result:
+            continue
+        result[key] = {periods[j]: float(row[j]) for j in np.flatnonzero(mask)}
+    return result
+
+
 def safe_to_decimal(value) -> Optional[Decimal]:
     """Safely convert a value to Decimal, handling various formats.
     
@@ -423,56 +593,62 @@ def fetch_and_reconcile_financials(ticker: str, end_date: str, zscore_model: str
     import pprint
     import time
     logger = logging.getLogger("altman_zscore.fetch_and_reconcile_financials")
-    output_dir = get_output_dir(ticker)
-    # Fetch SEC EDGAR data (raw)
-    try:
+    output_dir = Path(get_output_dir(ticker=ticker))
+    # Raw artifacts are written as soon as each fetch returns, so they survive a later
+    # failure; the derived debug artifacts are written concurrently right before the LLM call.
+    writes: List[Tuple[Path, Any]] = []
+    def fetch_sec_facts():
         from altman_zscore.api.sec_client import SECClient
         sec_client = SECClient()
         cik = sec_client.lookup_cik(ticker)
-        sec_facts = sec_client.get_company_facts(cik) if cik else None        # Save raw SEC facts before any filtering/processing
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        return sec_client.get_company_facts(cik) if cik else None
+
+    def serialize_yf_data(yf_data):
+        if not yf_data:
+            return None
+        result = {}
+        for k, v in yf_data.items():
+            if isinstance(v, pd.DataFrame):
+                # Use the same serialization method as financials_raw.json for consistency
+                result[k] = df_to_dict_str_keys(v)
+            elif hasattr(v, 'to_dict'):
+                try:
+                    result[k] = v.to_dict()
+                except Exception:
+                    result[k] = str(v)
+            else:
+                try:
+                    json.dumps(v)  # test if serializable
+                    result[k] = v
+                except Exception:
+                    result[k] = str(v)
+        return result
+
+    # SEC EDGAR and Yahoo Finance are independent network fetches; run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sec_future = executor.submit(fetch_sec_facts)
+        yf_future = executor.submit(fetch_yfinance_full, ticker)
+
+        # Fetch SEC EDGAR data (raw)
         try:
-            with open(os.path.join(output_dir, "sec_facts_raw.json"), "w", encoding="utf-8") as f:
-                json.dump(sec_facts, f, indent=2, ensure_ascii=False, default=str)
+            sec_facts = sec_future.result()
+            # Save raw SEC facts before any filtering/processing
+            _write_output_file(output_dir / "sec_facts_raw.json", sec_facts, ticker, logger)
         except Exception as e:
-            logger.warning(f"[{ticker}] Could not save raw SEC facts: {e}")
-    except Exception as e:
-        logger.warning(f"[{ticker}] SEC EDGAR fetch failed: {e}")
-        sec_facts = None
-    
-    # Fetch Yahoo Finance data (raw)
-    try:
-        yf_data = fetch_yfinance_full(ticker)
-        # Save raw Yahoo data before any filtering/processing
-        def serialize_yf_data(yf_data):
-            if not yf_data:
-                return None
-            result = {}
-            for k, v in yf_data.items():
-                if isinstance(v, pd.DataFrame):
-                    # Use the same serialization method as financials_raw.json for consistency
-                    result[k] = df_to_dict_str_keys(v)
-                elif hasattr(v, 'to_dict'):
-                    try:
-                        result[k] = v.to_dict()
-                    except Exception:
-                        result[k] = str(v)
-                else:
-                    try:
-                        json.dumps(v)  # test if serializable
-                        result[k] = v
-                    except Exception:
-                        result[k] = str(v)
-            return result
+            logger.warning(f"[{ticker}] SEC EDGAR fetch failed: {e}")
+            sec_facts = None
+
+        # Fetch Yahoo Finance data (raw)
         try:
-            with open(os.path.join(output_dir, "yahoo_raw.json"), "w", encoding="utf-8") as f:
-                json.dump(serialize_yf_data(yf_data), f, indent=2, ensure_ascii=False, default=str)
+            yf_data = yf_future.result()
+            # Save raw Yahoo data before any filtering/processing
+            try:
+                _write_output_file(output_dir / "yahoo_raw.json", serialize_yf_data(yf_data), ticker, logger)
+            except Exception as e:
+                logger.warning(f"[{ticker}] Could not save raw Yahoo data: {e}")
         except Exception as e:
-            logger.warning(f"[{ticker}] Could not save raw Yahoo data: {e}")
-    except Exception as e:
-        logger.warning(f"[{ticker}] Yahoo Finance fetch failed: {e}")
-        yf_data = None
+            logger.warning(f"[{ticker}] Yahoo Finance fetch failed: {e}")
+            yf_data = None
     # Prepare prompt for LLM reconciliation
     prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompts", "prompt_reconcile_financials.md")
     if not os.path.exists(prompt_path):
@@ -502,7 +678,8 @@ def fetch_and_reconcile_financials(ticker: str, end_date: str, zscore_model: str
         all_periods = set()
         for d in field_data.values():
             all_periods.update(d.keys())
-        last_periods = sorted(all_periods)[-8:]
+        # Keep only the 8 most recent periods without sorting the full history
+        last_periods = sorted(heapq.nlargest(8, all_periods))
         compact = {}
         for period in last_periods:        compact[str(period)] = {field: field_data.get(field, {}).get(period) for field in required_fields}
         return compact
@@ -547,22 +724,12 @@ def fetch_and_reconcile_financials(ticker: str, end_date: str, zscore_model: str
     sec_json = json.dumps(filtered_sec, indent=2, ensure_ascii=False) if filtered_sec else "null"
     yf_json = json.dumps(filtered_yf, indent=2, ensure_ascii=False) if filtered_yf else "null"
     # Save filtered data for debugging
-    try:
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        with open(os.path.join(output_dir, "sec_filtered.json"), "w", encoding="utf-8") as f:
-            f.write(sec_json)
-        with open(os.path.join(output_dir, "yahoo_filtered.json"), "w", encoding="utf-8") as f:
-            f.write(yf_json)
-    except Exception as e:
-        logger.warning(f"[{ticker}] Could not save filtered SEC/Yahoo data: {e}")
+    writes.append((output_dir / "sec_filtered.json", sec_json))
+    writes.append((output_dir / "yahoo_filtered.json", yf_json))
     prompt = prompt_template.replace("{sec_data}", sec_json).replace("{yahoo_data}", yf_json)
     # Save prompt for debugging
-    try:
-        with open(os.path.join(output_dir, "reconcile_prompt.txt"), "w", encoding="utf-8") as f:
-            f.write(prompt)
-    except Exception as e:
-        logger.warning(f"[{ticker}] Could not save LLM prompt: {e}")
+    writes.append((output_dir / "reconcile_prompt.txt", prompt))
+    _write_output_files(writes, ticker, logger)
     # Send prompt to LLM and get response
     try:
         client = AzureOpenAIClient()
@@ -591,8 +758,7 @@ def fetch_and_reconcile_financials(ticker: str, end_date: str, zscore_model: str
                 result_json = json.loads(reconciliation_result)
                 logger.info(f"[{ticker}] Successfully parsed reconciliation JSON.")
                 # Save reconciliation result
-                with open(os.path.join(output_dir, "reconciliation_result.json"), "w", encoding="utf-8") as f:
-                    json.dump(result_json, f, indent=2, ensure_ascii=False, default=str)
+                save_json(result_json, output_dir / "reconciliation_result.json")
                 return result_json
             except json.JSONDecodeError as e:
                 logger.warning(f"[{ticker}] JSON decoding error in reconciliation response: {e}")
@@ -1,24 +1,112 @@
 """
 Core financials logic for modularized financials pipeline in Altman Z-Score analysis.
 
-Provides helpers for DataFrame-to-dict conversion. Field mapping is now handled by Azure OpenAI.
+Provides helpers for DataFrame-to-dict conversion and for resolving field names against
+the labels a data source actually provides. Field mapping is now handled by Azure OpenAI.
 """
-from decimal import Decimal
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Callable, Dict, Any, FrozenSet, Iterable, List, Optional, Tuple, Union
 import pandas as pd
 
-def df_to_dict_str_keys(df: pd.DataFrame) -> Dict[str, Dict[str, Decimal]]:
-    """Convert DataFrame to dictionary with string keys and Decimal values.
+from altman_zscore.computation.constants import FIELD_SYNONYMS
+
+# Reverse of FIELD_SYNONYMS: canonical field -> alternate source labels, built once at import
+_CANONICAL_TO_SYNONYMS: Dict[str, Tuple[str, ...]] = {}
+for _synonym, _canonical in FIELD_SYNONYMS.items():
+    _CANONICAL_TO_SYNONYMS[_canonical] = _CANONICAL_TO_SYNONYMS.get(_canonical, ()) + (_synonym,)
+
+def df_to_dict_str_keys(df: pd.DataFrame, value_type: Callable[[str], Any] = float) -> Dict[str, Dict[str, Any]]:
+    """Convert DataFrame to dictionary with string keys and numeric values.
 
     Args:
         df (pd.DataFrame): DataFrame to convert.
+        value_type (Callable, optional): ``float`` (default) for a vectorized float64 conversion,
+            or a constructor such as ``Decimal`` that is applied to each cell's string form
+            when exact decimal values are needed.
 
     Returns:
-        dict: Dictionary with string row/column keys and Decimal values.
+        dict: Dictionary with string row/column keys and values of ``value_type``. NaN cells
+            become 0. With ``float``, frames holding non-numeric cells keep their raw values.
     """
     if not isinstance(df, pd.DataFrame):
         return {}
+    rows = [str(r) for r in df.index]
+    filled = df.fillna(0)
+    if value_type is float:
+        # One C-level cast for the whole frame; tolist() yields plain Python floats
+        try:
+            values = filled.to_numpy(dtype=float)
+        except (TypeError, ValueError):
+            values = filled.to_numpy(dtype=object)
+        return {str(col_key): dict(zip(rows, values[:, j].tolist())) for j, col_key in enumerate(df.columns)}
+    # Stringify as a whole array; only the per-cell constructor call stays in Python
+    text = filled.to_numpy(dtype=object).astype(str)
     return {
-        str(row_key): {str(col_key): Decimal(str(val)) if pd.notna(val) else Decimal("0") for col_key, val in row.items()}
-        for row_key, row in df.to_dict().items()
+        str(col_key): {rows[i]: value_type(val) for i, val in enumerate(text[:, j])}
+        for j, col_key in enumerate(df.columns)
     }
+
+
+class FieldIndex:
+    """Precomputed lookup tables for the labels one data source provides.
+
+    Build once per source (e.g. per balance sheet) and pass to find_matching_field so
+    each query is a couple of dict/set probes instead of a scan over the labels.
+
+    Args:
+        fields (Iterable[str]): Labels available in the source.
+    """
+
+    __slots__ = ("exact", "ci")
+
+    def __init__(self, fields: Iterable[str]):
+        # Sets have no meaningful order, so sort them to keep case-collision winners stable
+        names = sorted(fields) if isinstance(fields, (set, frozenset)) else list(fields)
+        self.exact: FrozenSet[str] = frozenset(names)
+        # Case-folded label -> original label; the first label wins when two differ only by case
+        self.ci: Dict[str, str] = {}
+        for name in names:
+            self.ci.setdefault(name.lower(), name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.exact
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+
+@lru_cache(maxsize=32)
+def _cached_field_index(available_fields: Tuple[str, ...]) -> FieldIndex:
+    """Return a FieldIndex for a tuple of labels, reused across calls with the same tuple."""
+    return FieldIndex(available_fields)
+
+
+def find_matching_field(field_name: str, available_fields: Union[FieldIndex, Iterable[str]]) -> Optional[str]:
+    """Resolve a raw or canonical field name to a label present in a data source.
+
+    Tries an exact match, then a case-insensitive match, then (for canonical names)
+    each synonym from FIELD_SYNONYMS the same way.
+
+    Args:
+        field_name (str): Raw label (e.g. from AI mapping) or canonical field name.
+        available_fields (FieldIndex or Iterable[str]): A prebuilt FieldIndex (preferred),
+            or the labels themselves; a tuple of labels is indexed once and cached.
+
+    Returns:
+        str or None: Matching label from the source, or None if nothing matches.
+    """
+    if not field_name:
+        return None
+    if isinstance(available_fields, FieldIndex):
+        idx = available_fields
+    else:
+        if not isinstance(available_fields, tuple):
+            available_fields = tuple(available_fields)
+        idx = _cached_field_index(available_fields)
+    for candidate in (field_name,) + _CANONICAL_TO_SYNONYMS.get(field_name, ()):
+        if candidate in idx.exact:
+            return candidate
+        hit = idx.ci.get(candidate.lower())
+        if hit is not None:
+            return hit
+    return None
@@ -4,35 +4,266 @@ Price and market data fetching and saving utilities for Altman Z-Score analysis.
 Provides functions to fetch, process, and save market price data for tickers, with robust error handling and fallback logic.
 """
 
+import asyncio
+import importlib.util
 import json
+import logging
+import os
+import random
+import time
 import warnings
-from datetime import datetime, timedelta
-from time import sleep
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from io import StringIO
+from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
+import requests
+from requests.adapters import HTTPAdapter
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+from urllib3.util.retry import Retry
 
+from altman_zscore.utils.cache import FileCache, cached
+from altman_zscore.utils.error_helpers import DataFetchingError
 from altman_zscore.utils.paths import get_output_dir
 from altman_zscore.utils.io import save_dataframe, get_output_file_path
 
-# Filter out yfinance warnings related to auto_adjust changes
-warnings.filterwarnings("ignore", category=UserWarning, module="yfinance")
-warnings.filterwarnings("ignore", message=".*auto_adjust.*")
+logger = logging.getLogger(__name__)
 
+# Historical daily bars for a fixed window do not change; keep them on disk for a week
+PRICE_CACHE_TTL = timedelta(days=7)
+# Windows ending within the last week can still gain bars; their cached copies expire hourly
+PRICE_RECENT_CACHE_TTL = timedelta(hours=1)
+# Upper bound on concurrent per-ticker market value lookups
+MARKET_VALUE_CONCURRENCY = 16
+# Maximum symbols per multi-ticker yfinance request
+YF_BATCH_SIZE = 20
+# Weekly stats for past windows are final; windows touching the last week are refreshed hourly
+WEEKLY_STATS_CACHE_TTL = timedelta(days=30)
+WEEKLY_STATS_RECENT_TTL = timedelta(hours=1)
+# Below this many tickers, batch_weekly_stats resamples inline rather than paying process start-up
+WEEKLY_STATS_PROCESS_MIN = 8
 
+# Span of exchange holidays precomputed for business-day snapping
+TRADING_CALENDAR_START = "1990-01-01"
+TRADING_CALENDAR_END = "2050-12-31"
+
+# yf.download attempts per window; empty results back off PRICE_RETRY_BASE_DELAY seconds, doubling
+PRICE_DOWNLOAD_ATTEMPTS = 3
+PRICE_RETRY_BASE_DELAY = 1.0
+
+# Stooq daily-bar CSV endpoint, used when yfinance is unavailable
+STOOQ_URL = "https://stooq.com/q/d/l/"
+STOOQ_MAX_CONNECTIONS = 20
+
+
+_weekly_stats_cache = FileCache("weekly", WEEKLY_STATS_CACHE_TTL)
+
+
+@lru_cache(maxsize=1)
+def _yf():
+    """Import yfinance on first use, so cache-served runs skip its import cost.
+
+    yfinance routes every yf.download / yf.Ticker request through one process-wide
+    curl_cffi session, so connections to Yahoo are already pooled and kept alive across
+    calls and threads. No ``session=`` is passed: a plain requests.Session lacks the
+    browser TLS impersonation Yahoo now requires and would replace that shared session.
+    """
+    import yfinance
+
+    # Filter out yfinance warnings related to auto_adjust changes
+    warnings.filterwarnings("ignore", category=UserWarning, module="yfinance")
+    warnings.filterwarnings("ignore", message=".*auto_adjust.*")
+    return yfinance
+
+
+def _yf_ticker(ticker: str):
+    """Return the shared yf.Ticker for a ticker (imported lazily, like yfinance itself)."""
+    from altman_zscore.api.yahoo_helpers import get_yf_ticker
+
+    return get_yf_ticker(ticker)
+
+
+def _price_cache_ttl(ticker: str, start: str, end: str, *args, **kwargs) -> Optional[timedelta]:
+    """Return PRICE_RECENT_CACHE_TTL for windows ending within the last week, else None (default TTL)."""
+    if _parse_date(end) >= pd.Timestamp.today().normalize() - timedelta(days=7):
+        return PRICE_RECENT_CACHE_TTL
+    return None
+
+
+@cached(namespace="prices", ttl=PRICE_CACHE_TTL, ttl_for=_price_cache_ttl)
+def _yf_download(ticker: str, start: str, end: str, auto_adjust: bool = False) -> pd.DataFrame:
+    """Download daily bars for one ticker via yfinance, cached on disk per (ticker, start, end).
+
+    Args:
+        ticker (str): Stock ticker symbol.
+        start (str): Start date in YYYY-MM-DD format.
+        end (str): End date in YYYY-MM-DD format (exclusive).
+        auto_adjust (bool, optional): Passed through to yf.download (default: False).
+
+    Returns:
+        pd.DataFrame: Downloaded data (may be empty; empty results are not cached).
+
+    Notes:
+        - Pass force_refresh=True to bypass the cache.
+        - Entries live PRICE_CACHE_TTL, or PRICE_RECENT_CACHE_TTL when the window ends
+          within the last week.
+        - Columns are single-level (Open, High, ..., Close). multi_level_index is not passed,
+          since yfinance releases before it was added reject the keyword.
+    """
+    # yf.download catches per-ticker failures, rate limits included, and returns an empty
+    # frame instead of raising, so rate limiting can only be detected from an empty result
+    df = _yf().download(
+        ticker,
+        start=start,
+        end=end,
+        progress=False,
+        auto_adjust=auto_adjust,
+        group_by="column",
+    )
+    # Newer yfinance returns (Price, Ticker) columns even for one ticker; keep the Price level
+    if isinstance(df, pd.DataFrame) and isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.droplevel(1)
+    return df
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> pd.Timestamp:
+    """Parse a YYYY-MM-DD string, memoized since the same quarter boundaries recur across tickers.
+
+    The explicit format takes pandas' fixed-format fast path instead of format inference.
+    """
+    return pd.to_datetime(date_str, format="%Y-%m-%d")
+
+
+class _ExchangeHolidayCalendar(AbstractHolidayCalendar):
+    """Full-day US equity market holidays (NYSE/Nasdaq rules, without one-off closures)."""
+
+    rules = [
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-01-01", observance=nearest_workday),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas Day", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+@lru_cache(maxsize=1)
+def _trading_calendar() -> np.busdaycalendar:
+    """Return a numpy business-day calendar with exchange holidays, built on first use."""
+    holidays = _ExchangeHolidayCalendar().holidays(start=TRADING_CALENDAR_START, end=TRADING_CALENDAR_END)
+    return np.busdaycalendar(holidays=holidays.values.astype("datetime64[D]"))
+
+
+@lru_cache(maxsize=4096)
 def get_last_business_day(date_str: str) -> str:
-    """Return the last business day (weekday) on or before the given date.
+    """Return the last US trading day on or before the given date.
 
     Args:
         date_str (str): Date string in YYYY-MM-DD format.
 
     Returns:
         str: Last business day in YYYY-MM-DD format.
+
+    Notes:
+        - Weekends and the exchange holidays in _ExchangeHolidayCalendar are skipped.
+        - Results are memoized; the function is pure.
     """
-    date = datetime.strptime(date_str, "%Y-%m-%d")
-    while date.weekday() > 4:
-        date -= timedelta(days=1)
-    return date.strftime("%Y-%m-%d")
+    return str(np.busday_offset(np.datetime64(date_str, "D"), 0, roll="backward", busdaycal=_trading_calendar()))
+
+
+def get_last_business_days(dates: Iterable[str]) -> np.ndarray:
+    """Vectorized get_last_business_day for many dates at once.
+
+    Args:
+        dates (Iterable[str]): Date strings in YYYY-MM-DD format.
+
+    Returns:
+        np.ndarray: Last business days as YYYY-MM-DD strings, in input order.
+    """
+    days = np.asarray(list(dates), dtype="datetime64[D]")
+    return np.busday_offset(days, 0, roll="backward", busdaycal=_trading_calendar()).astype(str)
+
+
+def _download_with_backoff(ticker: str, windows: list[tuple[str, str]], force_refresh: bool = False) -> pd.DataFrame:
+    """Try each (start, end) window in turn via _yf_download until one returns bars.
+
+    An empty frame is how yf.download reports a rate limit (and any other per-ticker
+    failure), so empty results and errors alike are followed by a jittered exponential
+    backoff (about PRICE_RETRY_BASE_DELAY, then twice that, ...) before the next attempt.
+
+    Returns:
+        pd.DataFrame: The first non-empty result, else the last (empty) one.
+
+    Raises:
+        Exception: The last download error, if every attempt raised.
+    """
+    df = pd.DataFrame()
+    last_error = None
+    for attempt, (start, end) in enumerate(windows):
+        if attempt:
+            delay = PRICE_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+            time.sleep(random.uniform(delay / 2, delay))
+        try:
+            df = _yf_download(ticker, start, end, force_refresh=force_refresh)
+        except Exception as e:
+            logger.warning(f"[{ticker}] Price download {start}..{end} failed (attempt {attempt + 1}): {e}")
+            last_error = e
+            continue
+        last_error = None
+        if isinstance(df, pd.DataFrame) and not df.empty:
+            return df
+        logger.debug(f"[{ticker}] Empty price download {start}..{end} (attempt {attempt + 1})")
+    if last_error is not None:
+        raise last_error
+    return df
+
+
+def download_prices(ticker: str, start: str, end: str, force_refresh: bool = False) -> pd.DataFrame:
+    """Download daily bars for a window via the on-disk price cache, backing off on empty results.
+
+    Args:
+        ticker (str): Stock ticker symbol.
+        start (str): Start date in YYYY-MM-DD format.
+        end (str): End date in YYYY-MM-DD format (exclusive).
+        force_refresh (bool, optional): Bypass and overwrite the cached entry (default: False).
+
+    Returns:
+        pd.DataFrame: Daily bars; empty if all PRICE_DOWNLOAD_ATTEMPTS came back empty.
+    """
+    return _download_with_backoff(ticker, [(start, end)] * PRICE_DOWNLOAD_ATTEMPTS, force_refresh)
+
+
+def _market_window(date: str, days_buffer: int) -> tuple[str, str]:
+    """Return the (start, end) window get_market_data downloads around ``date``."""
+    # Centre the window on a trading day, so holiday and weekend targets rarely need widening
+    day = _parse_date(get_last_business_day(date)).date()
+    return (day - timedelta(days=days_buffer)).isoformat(), (day + timedelta(days=days_buffer)).isoformat()
+
+
+def _quarter_window(start: str, end: str) -> tuple[str, str]:
+    """Return the single window get_quarter_price_change downloads for business days ``start``..``end``."""
+    window_start = (_parse_date(start).date() - timedelta(days=10)).isoformat()
+    window_end = (_parse_date(end).date() + timedelta(days=10)).isoformat()
+    return window_start, window_end
 
 
 def get_market_data(ticker: str, date: str, days_buffer: int = 5) -> pd.DataFrame:
@@ -48,34 +279,171 @@ def get_market_data(ticker: str, date: str, days_buffer: int = 5) -> pd.DataFram
 
     Raises:
         ValueError: If no data is available or download fails.
+
+    Notes:
+        - The window is centred on the last trading day on or before ``date``.
+        - An empty window (how yfinance reports rate limits too) is widened x2 and retried
+          after a jittered backoff, for PRICE_DOWNLOAD_ATTEMPTS attempts in all.
     """
     if not isinstance(date, str):
         raise ValueError("date must be a string in YYYY-MM-DD format")
-    date_obj = datetime.strptime(date, "%Y-%m-%d")
-    start_date = (date_obj - timedelta(days=days_buffer)).strftime("%Y-%m-%d")
-    end_date = (date_obj + timedelta(days=days_buffer)).strftime("%Y-%m-%d")
-    df = pd.DataFrame()
-    last_error = None
-    for attempt in range(3):
-        try:
-            df = yf.download(ticker, start=start_date, end=end_date, progress=False, auto_adjust=False)
-            if isinstance(df, pd.DataFrame) and not df.empty and len(df.index) > 0:
+    windows = [_market_window(date, days_buffer * 2**attempt) for attempt in range(PRICE_DOWNLOAD_ATTEMPTS)]
+    try:
+        df = _download_with_backoff(ticker, windows)
+    except Exception as e:
+        raise ValueError(f"No market data available for {ticker} around {date}: {e}")
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        raise ValueError(f"No market data available for {ticker} around {date}")
+    return df
+
+
+def _merge_intervals(intervals: Iterable[tuple[pd.Timestamp, pd.Timestamp]]) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    """Merge overlapping or touching [start, end) intervals into a sorted disjoint list."""
+    merged: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class PriceStore:
+    """Coalesces the price windows of one pipeline run into as few downloads as possible.
+
+    Schedule every window the run will need, call materialize() once, then pass the store
+    to get_quarter_price_change / get_market_value (or query it with slice()). Overlapping
+    windows for the same ticker, such as the quarter-change and market-value windows around
+    each quarter end, are merged into one request. Lookups the store cannot serve fall back
+    to the regular per-call download.
+
+    Example:
+        store = PriceStore()
+        for start, end in quarters:
+            store.schedule_quarter_price_change("AAPL", start, end)
+            store.schedule_market_value("AAPL", end)
+        store.materialize()
+        change = get_quarter_price_change("AAPL", start, end, store=store)
+    """
+
+    def __init__(self):
+        self._pending: dict[str, list[tuple[pd.Timestamp, pd.Timestamp]]] = {}
+        self._ranges: dict[str, list[tuple[pd.Timestamp, pd.Timestamp, pd.DataFrame]]] = {}
+
+    def schedule(self, ticker: str, start: str, end: str) -> None:
+        """Queue the window [start, end) (YYYY-MM-DD, end exclusive) for the next materialize()."""
+        self._pending.setdefault(ticker.upper(), []).append((_parse_date(start), _parse_date(end)))
+
+    def schedule_quarter_price_change(self, ticker: str, start: str, end: str) -> None:
+        """Queue the window get_quarter_price_change(ticker, start, end) reads."""
+        self.schedule(ticker, *_quarter_window(get_last_business_day(start), get_last_business_day(end)))
+
+    def schedule_market_value(self, ticker: str, date: str) -> None:
+        """Queue the window get_market_value(ticker, date) reads."""
+        self.schedule(ticker, *_market_window(date, 5))
+
+    def materialize(self) -> int:
+        """Download every merged pending window not already held by the store.
+
+        Failed or empty downloads are logged and skipped; their lookups fall back to
+        per-call downloads.
+
+        Returns:
+            int: Number of downloads issued.
+        """
+        downloads = 0
+        for ticker, intervals in self._pending.items():
+            ranges = self._ranges.setdefault(ticker, [])
+            for start, end in _merge_intervals(intervals):
+                if self._covering(ticker, start, end) is not None:
+                    continue
+                downloads += 1
+                try:
+                    df = download_prices(ticker, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
+                except Exception as e:
+                    logger.warning(f"[{ticker}] Could not prefetch prices {start.date()}..{end.date()}: {e}")
+                    continue
+                if isinstance(df, pd.DataFrame) and not df.empty:
+                    ranges.append((start, end, df))
+        self._pending.clear()
+        return downloads
+
+    def _covering(self, ticker: str, start: pd.Timestamp, end: pd.Timestamp):
+        for range_start, range_end, df in self._ranges.get(ticker, ()):
+            if range_start <= start and end <= range_end:
                 return df
-            if attempt < 2:
-                days_buffer *= 2
-                start_date = (date_obj - timedelta(days=days_buffer)).strftime("%Y-%m-%d")
-                end_date = (date_obj + timedelta(days=days_buffer)).strftime("%Y-%m-%d")
-                sleep(2**attempt)
-                continue
-        except Exception as e:
-            last_error = str(e)
-            if attempt < 2:
-                sleep(2**attempt)
-                continue
-    error_msg = f"No market data available for {ticker} around {date}"
-    if last_error:
-        error_msg += f": {last_error}"
-    raise ValueError(error_msg)
+        return None
+
+    def slice(self, ticker: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        """Return the held bars in [start, end), or None if no materialized window covers it.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            start (str): Start date in YYYY-MM-DD format.
+            end (str): End date in YYYY-MM-DD format (exclusive).
+
+        Returns:
+            pd.DataFrame or None: Bars for the window (possibly empty), or None when not held.
+        """
+        start_ts, end_ts = _parse_date(start), _parse_date(end)
+        df = self._covering(ticker.upper(), start_ts, end_ts)
+        if df is None:
+            return None
+        lo, hi = df.index.searchsorted([start_ts, end_ts])
+        return df.iloc[lo:hi]
+
+
+def get_market_data_batch(tickers: list[str], start: str, end: str) -> dict[str, pd.DataFrame]:
+    """Fetch daily bars for many tickers with one yfinance request per YF_BATCH_SIZE symbols.
+
+    Tickers already in the on-disk price cache for this window are served from it;
+    the rest are downloaded together and cached individually, so later per-ticker
+    calls for the same window (e.g. via get_start_end_prices) are cache hits. The
+    returned frames can also be passed straight to get_start_end_prices and
+    get_weekly_price_stats.
+
+    Args:
+        tickers (list[str]): Stock ticker symbols.
+        start (str): Start date in YYYY-MM-DD format.
+        end (str): End date in YYYY-MM-DD format (exclusive).
+
+    Returns:
+        dict[str, pd.DataFrame]: Ticker -> DataFrame of daily bars; tickers with no data are omitted.
+    """
+    cache = _yf_download.cache
+    results: dict[str, pd.DataFrame] = {}
+    misses = []
+    for ticker in dict.fromkeys(t.upper() for t in tickers):
+        hit = cache.get(ticker, _yf_download.cache_key(ticker, start, end))
+        if hit is not None:
+            results[ticker] = hit
+        else:
+            misses.append(ticker)
+    for i in range(0, len(misses), YF_BATCH_SIZE):
+        chunk = misses[i : i + YF_BATCH_SIZE]
+        data = _yf().download(
+            " ".join(chunk),
+            start=start,
+            end=end,
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            auto_adjust=False,
+        )
+        if not isinstance(data, pd.DataFrame) or data.empty:
+            continue
+        for ticker in chunk:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                df = data[ticker]
+            else:
+                df = data
+            df = df.dropna(how="all")
+            if not df.empty:
+                results[ticker] = df
+                cache.set(ticker, _yf_download.cache_key(ticker, start, end), df, ttl=_price_cache_ttl(ticker, start, end))
+    return results
 
 
 def get_market_data_with_fallback(ticker: str, date: str, days_buffer: int = 5) -> pd.DataFrame:
@@ -104,21 +472,91 @@ def get_market_data_with_fallback(ticker: str, date: str, days_buffer: int = 5)
         #     return df
         # except Exception:
         #     pass
-        # Try Stooq fallback (pseudo-code, requires implementation)
-        # try:
-        #     df = get_stooq_data(ticker, date, days_buffer)
-        #     df._source = 'stooq'
-        #     return df
-        # except Exception:
-        #     pass
-        raise ValueError(f"All market data sources failed for {ticker} around {date}: {e}")
+        try:
+            df = get_stooq_data(ticker, date, days_buffer)
+            df._source = "stooq"
+            logger.warning(f"[{ticker}] yfinance failed ({e}); using Stooq market data")
+            return df
+        except Exception as stooq_error:
+            raise ValueError(
+                f"All market data sources failed for {ticker} around {date}: yfinance: {e}; stooq: {stooq_error}"
+            )
+
+
+@lru_cache(maxsize=1)
+def _get_stooq_session() -> requests.Session:
+    """Return a pooled keep-alive session for Stooq, retrying transient HTTP failures."""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=STOOQ_MAX_CONNECTIONS, pool_maxsize=STOOQ_MAX_CONNECTIONS, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_stooq_data(ticker: str, date: str, days_buffer: int = 5) -> pd.DataFrame:
+    """Fetch daily bars for a US ticker around a target date from Stooq.
+
+    Args:
+        ticker (str): Stock ticker symbol.
+        date (str): Target date in YYYY-MM-DD format.
+        days_buffer (int, optional): Number of days before/after to include (default: 5).
+
+    Returns:
+        pd.DataFrame: Date-indexed DataFrame with Open, High, Low, Close and Volume columns.
+
+    Raises:
+        ValueError: If the request fails or Stooq returns no data.
+    """
+    date_obj = _parse_date(date)
+    params = {
+        "s": f"{ticker.lower()}.us",
+        "d1": (date_obj - timedelta(days=days_buffer)).strftime("%Y%m%d"),
+        "d2": (date_obj + timedelta(days=days_buffer)).strftime("%Y%m%d"),
+        "i": "d",
+    }
+    try:
+        response = _get_stooq_session().get(STOOQ_URL, params=params, timeout=10)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        raise ValueError(f"Stooq request failed for {ticker}: {e}")
+    text = response.text
+    if not text.startswith("Date,"):
+        raise ValueError(f"No Stooq data available for {ticker} around {date}")
+    df = pd.read_csv(StringIO(text), index_col="Date", parse_dates=["Date"])
+    if df.empty:
+        raise ValueError(f"No Stooq data available for {ticker} around {date}")
+    return df
+
+
+def close_series(df: pd.DataFrame) -> pd.Series:
+    """Return the 'Adj Close' (preferred) or 'Close' column as a flat Series.
+
+    Public so other packages reading yfinance frames share it. yfinance may return
+    MultiIndex columns, keyed (field, ticker) or, with group_by="ticker", (ticker, field);
+    the first column whose field matches is used in that case.
+
+    Raises:
+        ValueError: If neither column is present.
+    """
+    columns = df.columns
+    if isinstance(columns, pd.MultiIndex):
+        for field in ("Adj Close", "Close"):
+            for level in range(columns.nlevels):
+                matches = np.flatnonzero(columns.get_level_values(level) == field)
+                if matches.size:
+                    return df.iloc[:, matches[0]]
+    else:
+        for field in ("Adj Close", "Close"):
+            if field in columns:
+                return df[field]
+    raise ValueError("Neither 'Close' nor 'Adj Close' column found in data")
 
 
 def get_closest_price(df: pd.DataFrame, target_date: str) -> float:
     """Get the price closest to the target date from a DataFrame.
 
     Args:
-        df (pd.DataFrame): DataFrame of price data.
+        df (pd.DataFrame): DataFrame of price data, indexed by ascending date.
         target_date (str): Target date in YYYY-MM-DD format.
 
     Returns:
@@ -130,38 +568,68 @@ def get_closest_price(df: pd.DataFrame, target_date: str) -> float:
     if df.empty:
         raise ValueError("No price data available")
     try:
-        target = pd.to_datetime(target_date)
-        closest_idx = df.index.get_indexer([target], method="nearest")[0]
-        close_col = "Adj Close" if "Adj Close" in df.columns else "Close"
-        if close_col not in df.columns:
-            raise ValueError("Neither 'Close' nor 'Adj Close' column found in data")
-        price = df[close_col].iloc[closest_idx]
-        # Fix for FutureWarning: float on single-element Series
-        if isinstance(price, pd.Series):
-            price = price.iloc[0]
-        return float(price)
+        index = df.index if isinstance(df.index, pd.DatetimeIndex) else pd.DatetimeIndex(df.index)
+        target = _parse_date(target_date) if isinstance(target_date, str) else pd.Timestamp(target_date)
+        if index.tz is not None and target.tz is None:
+            target = target.tz_localize(index.tz)
+        # Binary search on the raw datetime64 values (UTC for tz-aware indexes), then step back
+        # if the previous bar is strictly nearer; avoids Timestamp boxing on every comparison
+        values = index.values
+        t = target.to_datetime64()
+        pos = int(values.searchsorted(t))
+        if pos == len(values):
+            pos -= 1
+        elif pos > 0 and t - values[pos - 1] < values[pos] - t:
+            pos -= 1
+        return float(close_series(df).to_numpy()[pos])
     except Exception as e:
         raise ValueError(f"Error getting closest price: {str(e)}")
 
 
-def get_quarter_price_change(ticker: str, start: str, end: str) -> float:
+def get_quarter_price_change(ticker: str, start: str, end: str, store: Optional[PriceStore] = None) -> float:
     """Calculate the percentage price change for a ticker between two dates.
 
     Args:
         ticker (str): Stock ticker symbol.
         start (str): Start date in YYYY-MM-DD format.
         end (str): End date in YYYY-MM-DD format.
+        store (PriceStore, optional): Materialized store to read the window from; the
+            window is downloaded when omitted or not held by the store.
 
     Returns:
         float: Percentage price change.
 
     Raises:
         ValueError: If calculation fails.
+
+    Notes:
+        - Without a store, successful results are memoized per (ticker, start, end) for the
+          process lifetime; failures are not cached. The underlying bars also come from the
+          on-disk price cache.
     """
+    if store is None:
+        return _memo_quarter_price_change(ticker, start, end)
+    return _quarter_price_change(ticker, start, end, store)
+
+
+@lru_cache(maxsize=16384)
+def _memo_quarter_price_change(ticker: str, start: str, end: str) -> float:
+    """Memoized get_quarter_price_change for calls without a store."""
+    return _quarter_price_change(ticker, start, end)
+
+
+def _quarter_price_change(ticker: str, start: str, end: str, store: Optional[PriceStore] = None) -> float:
+    """Compute get_quarter_price_change, reading the window from ``store`` when it holds it."""
     start = get_last_business_day(start)
     end = get_last_business_day(end)
     try:
-        df = get_market_data(ticker, start, days_buffer=10)
+        # One window spanning both dates, so the end price is not sampled from around the start
+        window = _quarter_window(start, end)
+        df = store.slice(ticker, *window) if store is not None else None
+        if df is None:
+            df = download_prices(ticker, *window)
+        if df is None or df.empty:
+            raise ValueError(f"No market data available for {ticker} between {start} and {end}")
         start_price = get_closest_price(df, start)
         end_price = get_closest_price(df, end)
         return (end_price - start_price) / start_price * 100
@@ -169,64 +637,250 @@ def get_quarter_price_change(ticker: str, start: str, end: str) -> float:
         raise ValueError(f"Error calculating price change for {ticker}: {str(e)}")
 
 
-def get_market_value(ticker: str, date: str) -> float:
+def _nearest_closes(df: pd.DataFrame, targets: pd.DatetimeIndex) -> tuple[np.ndarray, np.ndarray]:
+    """Return (YYYY-MM-DD dates, closes) of the bars nearest each target (see get_closest_price)."""
+    close = close_series(df)
+    index = close.index if isinstance(close.index, pd.DatetimeIndex) else pd.DatetimeIndex(close.index)
+    if index.tz is not None and targets.tz is None:
+        targets = targets.tz_localize(index.tz)
+    positions = index.get_indexer(targets, method="nearest")
+    return np.asarray(index[positions].strftime("%Y-%m-%d")), close.to_numpy(dtype=float)[positions]
+
+
+def get_quarterly_prices(ticker: str, quarters: Iterable) -> pd.DataFrame:
+    """Get the close nearest to each quarter end for a ticker, from one download.
+
+    A single window spanning every quarter end (+/- 10 days) is downloaded and the
+    nearest bar for all dates is located in one vectorized lookup, instead of one
+    get_market_data request per quarter.
+
+    Args:
+        ticker (str): Stock ticker symbol.
+        quarters (Iterable): Quarter-end dates as YYYY-MM-DD strings (a trailing time part
+            is ignored), dates or Timestamps.
+
+    Returns:
+        pd.DataFrame: One row per quarter, in input order, with columns:
+            - quarter_end (str): Quarter-end date (YYYY-MM-DD)
+            - price_date (str): Date of the bar used (YYYY-MM-DD)
+            - price (float): Close on price_date
+
+    Raises:
+        ValueError: If no quarters are given or no price data is available.
+
+    Notes:
+        - If the combined window comes back empty, each quarter is fetched on its own via
+          get_market_data; quarters that still fail get a NaN price and are logged.
+    """
+    targets = pd.to_datetime([str(q)[:10] for q in quarters], format="%Y-%m-%d")
+    if targets.empty:
+        raise ValueError("No quarters given")
+    quarter_ends = targets.strftime("%Y-%m-%d")
+    window_start = (targets.min() - timedelta(days=10)).strftime("%Y-%m-%d")
+    window_end = (targets.max() + timedelta(days=10)).strftime("%Y-%m-%d")
+    try:
+        df = download_prices(ticker, window_start, window_end)
+    except Exception as e:
+        logger.warning(f"[{ticker}] Combined quarterly price download failed: {e}")
+        df = None
+
+    if isinstance(df, pd.DataFrame) and not df.empty:
+        price_dates, prices = _nearest_closes(df, targets)
+        return pd.DataFrame({"quarter_end": quarter_ends, "price_date": price_dates, "price": prices})
+
+    rows = []
+    for quarter_end, target in zip(quarter_ends, targets):
+        try:
+            price_dates, prices = _nearest_closes(get_market_data(ticker, quarter_end), pd.DatetimeIndex([target]))
+            rows.append((quarter_end, price_dates[0], prices[0]))
+        except ValueError as e:
+            logger.warning(f"[{ticker}] No price for quarter ending {quarter_end}: {e}")
+            rows.append((quarter_end, None, np.nan))
+    result = pd.DataFrame(rows, columns=["quarter_end", "price_date", "price"])
+    if result["price"].isna().all():
+        raise ValueError(f"No price data available for {ticker} between {window_start} and {window_end}")
+    return result
+
+
+# fast_info fields read by get_market_value
+FAST_INFO_FIELDS = ("market_cap", "last_price", "shares", "enterprise_value", "total_debt", "total_cash")
+
+
+def _fast_info_value(fast_info, name: str):
+    """Return a numeric fast_info field, or None if it is missing or cannot be fetched."""
+    try:
+        value = getattr(fast_info, name, None)
+    except Exception:
+        return None
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+@lru_cache(maxsize=1024)
+def _fast_info_dict(ticker: str) -> dict:
+    """Snapshot a ticker's fast_info fields into a plain dict, once per process.
+
+    Raises:
+        DataFetchingError: If none of the fields could be read (so the miss is not memoized).
+    """
+    fast_info = getattr(_yf_ticker(ticker), "fast_info", None)
+    snapshot = {name: _fast_info_value(fast_info, name) for name in FAST_INFO_FIELDS}
+    if all(v is None for v in snapshot.values()):
+        raise DataFetchingError(f"fast_info unavailable for {ticker}")
+    return snapshot
+
+
+@lru_cache(maxsize=1024)
+def _info_dict(ticker: str) -> dict:
+    """Snapshot a ticker's .info into a plain dict, once per process."""
+    return dict(_yf_ticker(ticker).info or {})
+
+
+def clear_caches() -> None:
+    """Drop the in-process ticker, fast_info/info and price-change memos (for long-running processes)."""
+    from altman_zscore.api.yahoo_helpers import get_yf_ticker
+
+    _fast_info_dict.cache_clear()
+    _info_dict.cache_clear()
+    _memo_quarter_price_change.cache_clear()
+    get_yf_ticker.cache_clear()
+
+
+def get_market_value(ticker: str, date: str, store: Optional[PriceStore] = None) -> float:
     """Estimate the market value of a ticker on a given date.
 
     Args:
         ticker (str): Stock ticker symbol.
         date (str): Target date in YYYY-MM-DD format.
+        store (PriceStore, optional): Materialized store to read prices from; prices are
+            downloaded when omitted or not held by the store.
 
     Returns:
         float: Estimated market value.
 
     Raises:
         ValueError: If calculation or data retrieval fails.
+
+    Notes:
+        - Prefers fast_info.market_cap scaled by the historical/last price ratio, then shares
+          outstanding from fast_info/info times the close nearest the date; both avoid fetching
+          the quarterly balance sheet, which is only used (with an enterprise-value estimate)
+          as a last resort.
+        - Every path prices the ticker with get_closest_price, so the result does not depend
+          on where the date falls in the downloaded window.
+        - fast_info and info are read once per ticker per process (see clear_caches).
     """
+    def price_on_date() -> float:
+        df = store.slice(ticker, *_market_window(date, 5)) if store is not None else None
+        if df is None or df.empty:
+            df = get_market_data(ticker, date)
+        return get_closest_price(df, date)
+
     try:
-        ticker_obj = yf.Ticker(ticker)
-        shares = None
         try:
-            financials = ticker_obj.quarterly_balance_sheet
+            fast_info = _fast_info_dict(ticker)
+        except Exception:
+            fast_info = {}
+        market_cap = fast_info.get("market_cap")
+        last_price = fast_info.get("last_price")
+        if market_cap and market_cap > 0 and last_price:
+            return float(market_cap * (price_on_date() / last_price))
+        shares = fast_info.get("shares")
+        if not shares:
+            try:
+                shares = _info_dict(ticker).get("sharesOutstanding")
+            except Exception:
+                shares = None
+        if shares:
+            return float(shares * price_on_date())
+        try:
+            financials = _yf_ticker(ticker).quarterly_balance_sheet
             if not financials.empty:
                 shares = financials.iloc[0].get("CommonStockSharesOutstanding")
         except Exception:
             pass
         if not shares:
-            fast_info = getattr(ticker_obj, "fast_info", None)
-            if fast_info:
-                ev = getattr(fast_info, "enterprise_value", None)
-                debt = getattr(fast_info, "total_debt", 0) or 0
-                cash = getattr(fast_info, "total_cash", 0) or 0
-                if ev is not None and all(isinstance(v, (int, float)) for v in [ev, debt, cash]):
-                    market_cap = float(ev) - float(debt) + float(cash)
-                    if market_cap > 0:
-                        df = get_market_data(ticker, date)
-                        close_col = "Adj Close" if "Adj Close" in df.columns else "Close"
-                        if close_col not in df.columns:
-                            raise ValueError("Neither 'Close' nor 'Adj Close' column found in data")
-                        current_price = ticker_obj.info.get("regularMarketPrice")
-                        if current_price:
-                            historical_price = df[close_col].iloc[0]
-                            return float(market_cap * (historical_price / current_price))
+            ev = fast_info.get("enterprise_value")
+            debt = fast_info.get("total_debt") or 0.0
+            cash = fast_info.get("total_cash") or 0.0
+            if ev is not None:
+                market_cap = ev - debt + cash
+                if market_cap > 0:
+                    current_price = _info_dict(ticker).get("regularMarketPrice")
+                    if current_price:
+                        return float(market_cap * (price_on_date() / current_price))
         if shares:
-            df = get_market_data(ticker, date)
-            close_col = "Adj Close" if "Adj Close" in df.columns else "Close"
-            if close_col not in df.columns:
-                raise ValueError("Neither 'Close' nor 'Adj Close' column found in data")
-            price = df[close_col].iloc[0]
-            return float(shares * price)
+            return float(shares * price_on_date())
         raise ValueError(f"Could not fetch shares outstanding or market cap for {ticker}")
     except Exception as e:
         raise ValueError(f"Error calculating market value for {ticker}: {str(e)}")
 
 
-def get_start_end_prices(ticker: str, start_date: str, end_date: str) -> tuple[float, float]:
+async def get_market_value_async(ticker: str, date: str, sem: asyncio.Semaphore) -> float:
+    """Run get_market_value in a worker thread, bounded by a shared semaphore.
+
+    Args:
+        ticker (str): Stock ticker symbol.
+        date (str): Target date in YYYY-MM-DD format.
+        sem (asyncio.Semaphore): Limits how many blocking lookups run at once.
+
+    Returns:
+        float: Estimated market value.
+
+    Raises:
+        ValueError: If calculation or data retrieval fails.
+    """
+    async with sem:
+        return await asyncio.to_thread(get_market_value, ticker, date)
+
+
+async def _gather_market_values(tickers: list[str], date: str, concurrency: int) -> list:
+    sem = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(get_market_value_async(t, date, sem) for t in tickers), return_exceptions=True
+    )
+
+
+def gather_market_values(tickers: list[str], date: str, concurrency: int = MARKET_VALUE_CONCURRENCY) -> dict[str, float]:
+    """Estimate market values for many tickers concurrently.
+
+    get_market_value needs per-ticker metadata (balance sheet, fast_info) that cannot be
+    batched, so the blocking calls are fanned out over threads with at most
+    ``concurrency`` in flight.
+
+    Args:
+        tickers (list[str]): Stock ticker symbols.
+        date (str): Target date in YYYY-MM-DD format.
+        concurrency (int, optional): Maximum concurrent lookups (default: MARKET_VALUE_CONCURRENCY).
+
+    Returns:
+        dict[str, float]: Ticker -> market value; tickers that failed are omitted and logged.
+
+    Notes:
+        - Must be called from synchronous code (it runs its own event loop).
+    """
+    if not tickers:
+        return {}
+    outcomes = asyncio.run(_gather_market_values(tickers, date, concurrency))
+    values: dict[str, float] = {}
+    for ticker, outcome in zip(tickers, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning(f"[{ticker}] Market value unavailable: {outcome}")
+        else:
+            values[ticker] = outcome
+    return values
+
+
+def get_start_end_prices(
+    ticker: str, start_date: str, end_date: str, df: Optional[pd.DataFrame] = None
+) -> tuple[float, float]:
     """Fetch the start and end prices for a ticker between two dates.
 
     Args:
         ticker (str): Stock ticker symbol.
         start_date (str): Start date in YYYY-MM-DD format.
         end_date (str): End date in YYYY-MM-DD format.
+        df (pd.DataFrame, optional): Pre-fetched daily bars for this window (e.g. from
+            get_market_data_batch); downloaded when omitted.
 
     Returns:
         tuple[float, float]: Tuple containing start and end prices.
@@ -234,31 +888,61 @@ def get_start_end_prices(ticker: str, start_date: str, end_date: str) -> tuple[f
     Raises:
         ValueError: If no data is available or access to data fails.
     """
-    df = yf.download(ticker, start=start_date, end=end_date, progress=False, auto_adjust=False)
+    if df is None:
+        df = download_prices(ticker, start_date, end_date)
     if df is None or df.empty:
         raise ValueError(f"No price data available for {ticker}")
     try:
-        close_col = "Adj Close" if "Adj Close" in df.columns else "Close"
-        if close_col not in df.columns:
-            raise ValueError("Neither 'Close' nor 'Adj Close' column found in data")
-        start_price = df[close_col].iloc[0]
-        if isinstance(start_price, pd.Series):
-            start_price = start_price.iloc[0]
-        end_price = df[close_col].iloc[-1]
-        if isinstance(end_price, pd.Series):
-            end_price = end_price.iloc[0]
-        return float(start_price), float(end_price)
+        prices = close_series(df).to_numpy()
+        return float(prices[0]), float(prices[-1])
     except (IndexError, KeyError) as e:
         raise ValueError(f"Error accessing price data for {ticker}: {str(e)}")
 
 
-def get_weekly_price_stats(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+def get_return(ticker: str, start_date: str, end_date: str, df: Optional[pd.DataFrame] = None) -> float:
+    """Compute the simple price return of a ticker between two dates.
+
+    Equivalent to ``(end - start) / start`` on the result of get_start_end_prices, computed
+    directly on the close array.
+
+    Args:
+        ticker (str): Stock ticker symbol.
+        start_date (str): Start date in YYYY-MM-DD format.
+        end_date (str): End date in YYYY-MM-DD format.
+        df (pd.DataFrame, optional): Pre-fetched daily bars for this window; downloaded when omitted.
+
+    Returns:
+        float: Fractional return over the window (0.05 for +5%).
+
+    Raises:
+        ValueError: If no data is available or the start price is zero.
+    """
+    if df is None:
+        df = download_prices(ticker, start_date, end_date)
+    if df is None or df.empty:
+        raise ValueError(f"No price data available for {ticker}")
+    close = close_series(df).to_numpy(dtype=float)
+    if close[0] == 0:
+        raise ValueError(f"Start price for {ticker} is zero; return is undefined")
+    return float((close[-1] - close[0]) / close[0])
+
+
+def get_weekly_price_stats(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    force_refresh: bool = False,
+    prices: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
     """Get weekly price statistics (average, min, max) for a stock.
 
     Args:
         ticker (str): Stock ticker symbol
         start_date (str): Start date in YYYY-MM-DD format
         end_date (str): End date in YYYY-MM-DD format
+        force_refresh (bool, optional): Bypass and overwrite the on-disk stats cache (default: False).
+        prices (pd.DataFrame, optional): Pre-fetched daily bars for this window (e.g. from
+            get_market_data_batch); downloaded when omitted.
 
     Returns:
         pd.DataFrame: DataFrame with columns:
@@ -270,113 +954,256 @@ def get_weekly_price_stats(ticker: str, start_date: str, end_date: str) -> pd.Da
 
     Raises:
         ValueError: If no data is available for the specified period
+
+    Notes:
+        - Results are cached on disk per (ticker, start_date, end_date) for WEEKLY_STATS_CACHE_TTL,
+          or WEEKLY_STATS_RECENT_TTL when the window ends within the last week.
+        - When ``prices`` is given the cache is skipped entirely: the stats are computed from
+          those bars, and a stats entry for the window is neither read nor overwritten.
     """
     # Validate dates
-    start = pd.to_datetime(start_date)
-    end = pd.to_datetime(end_date)
+    start = _parse_date(start_date)
+    end = _parse_date(end_date)
     if end < start:
         raise ValueError(f"End date {end_date} is before start date {start_date}")
 
-    df = None
-    try:
-        # Fetch daily data with retries
-        for attempt in range(3):
-            try:
-                df = yf.download(ticker, start=start_date, end=end_date, progress=False, auto_adjust=False)
-                if isinstance(df, pd.DataFrame) and not df.empty:
-                    break
-                if attempt < 2:
-                    sleep(2**attempt)
-            except Exception:
-                if attempt < 2:
-                    sleep(2**attempt)
-                continue
+    if prices is not None:
+        # Stats for caller-supplied bars are neither served from nor written to the cache
+        return _compute_weekly_price_stats(ticker, start_date, end_date, prices=prices)
+
+    key = FileCache.make_key(ticker.upper(), start_date, end_date)
+    if not force_refresh:
+        hit = _weekly_stats_cache.get(ticker, key)
+        if hit is not None:
+            return hit
+    recent = end >= pd.Timestamp.today().normalize() - timedelta(days=7)
+    weekly_stats = _compute_weekly_price_stats(ticker, start_date, end_date, refresh_prices=force_refresh or recent)
+    _weekly_stats_cache.set(ticker, key, weekly_stats, ttl=WEEKLY_STATS_RECENT_TTL if recent else None)
+    return weekly_stats
+
 
+def _compute_weekly_price_stats(
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    refresh_prices: bool = False,
+    prices: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Aggregate daily bars into weekly stats (see get_weekly_price_stats).
+
+    Bars are downloaded unless ``prices`` is given; ``refresh_prices`` bypasses the
+    daily-bar cache, so recent windows pick up new bars.
+    """
+    try:
+        df = prices if prices is not None else download_prices(ticker, start_date, end_date, force_refresh=refresh_prices)
         if df is None or not isinstance(df, pd.DataFrame) or df.empty:
             raise ValueError(f"No price data available for {ticker} between {start_date} and {end_date}")
 
-        # Handle MultiIndex columns from yfinance
-        if isinstance(df.columns, pd.MultiIndex):
-            # Find the Close or Adj Close column
-            close_cols = [c for c in df.columns if c[0] in ("Close", "Adj Close")]
-            if not close_cols:
-                raise ValueError("Neither 'Close' nor 'Adj Close' column found in data")
-            close_col = close_cols[0]  # Use the first one found
-            df = df[close_col]  # Select just the close price series
+        return _weekly_stats_from_close(ticker, close_series(df))
+
+    except Exception as e:
+        raise ValueError(f"Error fetching weekly price statistics for {ticker}: {str(e)}")
+
+
+def _weekly_stats_from_close(ticker: str, close: pd.Series) -> pd.DataFrame:
+    """Aggregate a daily close Series into weekly stats.
+
+    Module-level and free of I/O so it can run in a process pool (see batch_weekly_stats).
+    """
+    if not isinstance(close.index, pd.DatetimeIndex):
+        close.index = pd.to_datetime(close.index)
+
+    # Bin into Monday-start weeks labelled by their Monday; weeks without trading days are dropped
+    weekly_stats = close.resample("W-MON", label="left", closed="left").agg(
+        avg_price="mean", min_price="min", max_price="max", days_with_data="count"
+    )
+    weekly_stats = weekly_stats[weekly_stats["days_with_data"] > 0]
+    if weekly_stats.empty:
+        raise ValueError(f"No weekly statistics could be calculated for {ticker}")
+    weekly_stats.insert(0, "week", weekly_stats.index.date)
+    return weekly_stats.reset_index(drop=True)
+
+
+def batch_weekly_stats(
+    tickers: Iterable[str], start_date: str, end_date: str, workers: Optional[int] = None
+) -> dict[str, pd.DataFrame]:
+    """Get weekly price statistics for many tickers at once.
+
+    Daily bars for tickers missing from the weekly stats cache are fetched with one
+    get_market_data_batch call; the resampling is then spread over a process pool once
+    there are at least WEEKLY_STATS_PROCESS_MIN tickers to aggregate.
+
+    Args:
+        tickers (Iterable[str]): Stock ticker symbols.
+        start_date (str): Start date in YYYY-MM-DD format.
+        end_date (str): End date in YYYY-MM-DD format.
+        workers (int, optional): Process pool size (default: os.cpu_count()).
+
+    Returns:
+        dict[str, pd.DataFrame]: Upper-cased ticker -> frame shaped like get_weekly_price_stats;
+            tickers without data are omitted and logged.
+    """
+    end = _parse_date(end_date)
+    if end < _parse_date(start_date):
+        raise ValueError(f"End date {end_date} is before start date {start_date}")
+    recent = end >= pd.Timestamp.today().normalize() - timedelta(days=7)
+
+    results: dict[str, pd.DataFrame] = {}
+    misses = []
+    for ticker in dict.fromkeys(t.upper() for t in tickers):
+        hit = _weekly_stats_cache.get(ticker, FileCache.make_key(ticker, start_date, end_date))
+        if hit is not None:
+            results[ticker] = hit
         else:
-            # For single-level columns, keep original logic
-            close_col = "Adj Close" if "Adj Close" in df.columns else "Close"
-            if close_col not in df.columns:
-                raise ValueError("Neither 'Close' nor 'Adj Close' column found in data")
-            df = df[close_col]
+            misses.append(ticker)
+    if not misses:
+        return results
 
-        # Ensure index is datetime
-        if not isinstance(df.index, pd.DatetimeIndex):
-            df.index = pd.to_datetime(df.index)
-        # Create week column for grouping (Monday start weeks)
-        week_periods = df.index.to_period("W")
+    closes = {}
+    for ticker, df in get_market_data_batch(misses, start_date, end_date).items():
+        try:
+            closes[ticker] = close_series(df)
+        except ValueError as e:
+            logger.warning(f"[{ticker}] Weekly price stats unavailable: {e}")
+
+    def aggregate(map_fn) -> None:
+        for ticker, outcome in zip(closes, map_fn(_safe_weekly_stats, closes, closes.values())):
+            if isinstance(outcome, Exception):
+                logger.warning(f"[{ticker}] Weekly price stats unavailable: {outcome}")
+                continue
+            results[ticker] = outcome
+            _weekly_stats_cache.set(
+                ticker,
+                FileCache.make_key(ticker, start_date, end_date),
+                outcome,
+                ttl=WEEKLY_STATS_RECENT_TTL if recent else None,
+            )
+
+    if len(closes) < WEEKLY_STATS_PROCESS_MIN:
+        aggregate(map)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(closes))) as executor:
+            aggregate(executor.map)
+    return results
 
-        # Create temporary dataframe for grouping
-        temp_df = pd.DataFrame({"week_period": week_periods, "price": df.values})
 
-        # Group by week periods and calculate statistics
-        weekly_stats = temp_df.groupby("week_period").agg({"price": ["mean", "min", "max", "count"]}).reset_index()
+def _safe_weekly_stats(ticker: str, close: pd.Series):
+    """Process-pool wrapper returning the exception instead of raising it."""
+    try:
+        return _weekly_stats_from_close(ticker, close)
+    except Exception as e:
+        return e
 
-        # Flatten multi-level columns
-        weekly_stats.columns = [
-            "week_period",
-            "avg_price",
-            "min_price",
-            "max_price",
-            "days_with_data",
-        ]
 
-        # Convert week periods to actual Monday start dates
-        weekly_stats["week"] = weekly_stats["week_period"].apply(lambda x: x.start_time.date())
+def get_monthly_price_stats(
+    ticker: str, start_date: str, end_date: str, prices: Optional[pd.DataFrame] = None
+) -> pd.DataFrame:
+    """Get monthly price statistics (average, min, max) for a stock.
 
-        # Ensure weekly_stats is a DataFrame before selecting columns
-        if not isinstance(weekly_stats, pd.DataFrame):
-            raise ValueError("Expected weekly_stats to be a DataFrame")
+    Monthly counterpart of get_weekly_price_stats, in the shape
+    plotting.plot_helpers.prepare_monthly_price_stats_for_plotting expects.
+
+    Args:
+        ticker (str): Stock ticker symbol
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        prices (pd.DataFrame, optional): Pre-fetched daily bars for this window; downloaded when omitted.
 
-        # Reorder columns and drop the period column
-        weekly_stats = weekly_stats.loc[:, ["week", "avg_price", "min_price", "max_price", "days_with_data"]]
+    Returns:
+        pd.DataFrame: DataFrame with columns:
+            - month (datetime): First day of each month
+            - avg_price (float): Average closing price for the month
+            - min_price (float): Minimum closing price for the month
+            - max_price (float): Maximum closing price for the month
+            - days_with_data (int): Number of trading days with data
 
-        # Validate results
-        if weekly_stats.empty:
-            raise ValueError(f"No weekly statistics could be calculated for {ticker}")
+    Raises:
+        ValueError: If no data is available for the specified period
+    """
+    if _parse_date(end_date) < _parse_date(start_date):
+        raise ValueError(f"End date {end_date} is before start date {start_date}")
+    try:
+        df = prices if prices is not None else download_prices(ticker, start_date, end_date)
+        if df is None or not isinstance(df, pd.DataFrame) or df.empty:
+            raise ValueError(f"No price data available for {ticker} between {start_date} and {end_date}")
+        close = close_series(df)
+        if not isinstance(close.index, pd.DatetimeIndex):
+            close.index = pd.to_datetime(close.index)
 
-        return pd.DataFrame(weekly_stats)  # Ensure the return type is a DataFrame
+        # One resample pass over month-start bins; months without trading days are dropped
+        monthly_stats = close.resample("MS").agg(
+            avg_price="mean", min_price="min", max_price="max", days_with_data="count"
+        )
+        monthly_stats = monthly_stats[monthly_stats["days_with_data"] > 0]
+        if monthly_stats.empty:
+            raise ValueError(f"No monthly statistics could be calculated for {ticker}")
+        monthly_stats.insert(0, "month", monthly_stats.index.date)
+        return monthly_stats.reset_index(drop=True)
 
     except Exception as e:
-        raise ValueError(f"Error fetching weekly price statistics for {ticker}: {str(e)}")
+        raise ValueError(f"Error fetching monthly price statistics for {ticker}: {str(e)}")
+
+
+@lru_cache(maxsize=1)
+def _parquet_available() -> bool:
+    """Return True if pandas has a Parquet engine (pyarrow or fastparquet) installed."""
+    return any(importlib.util.find_spec(engine) is not None for engine in ("pyarrow", "fastparquet"))
 
 
-def save_price_data_to_disk(df: pd.DataFrame, ticker: str, file_prefix: str) -> tuple[str, str]:
-    """Save price data to disk as CSV and JSON files.
+def save_price_data_to_disk(df: pd.DataFrame, ticker: str, file_prefix: str, fmt: str = "csv") -> tuple[str, str]:
+    """Save price data to disk as a CSV (or Parquet) file plus a JSON file.
 
     Args:
         df (pd.DataFrame): DataFrame containing price data.
         ticker (str): Stock ticker symbol.
         file_prefix (str): Prefix for output file names.
+        fmt (str, optional): 'csv' (default) or 'parquet' (zstd-compressed, dtypes preserved).
+            Falls back to CSV with a warning if no Parquet engine is installed.
 
     Returns:
-        tuple[str, str]: Tuple containing CSV and JSON file paths.
+        tuple[str, str]: Tuple containing the CSV/Parquet and JSON file paths.
 
     Raises:
-        ValueError: If no data is available to save.
+        ValueError: If no data is available to save or the format is unsupported.
         IOError: If file saving fails.
     """
     if df is None or df.empty:
         raise ValueError("No price data to save")
-    csv_path = get_output_file_path(ticker, file_prefix, ext="csv")
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported price data format: {fmt}")
+    if fmt == "parquet" and not _parquet_available():
+        logger.warning(f"[{ticker}] No Parquet engine installed; saving {file_prefix} as CSV")
+        fmt = "csv"
+    data_path = get_output_file_path(ticker, file_prefix, ext=fmt)
     json_path = get_output_file_path(ticker, file_prefix, ext="json")
     try:
-        df_copy = df.copy()
-        datetime_cols = [col for col in df_copy.columns if pd.api.types.is_datetime64_any_dtype(df_copy[col])]
-        for col in datetime_cols:
-            df_copy[col] = df_copy[col].dt.strftime("%Y-%m-%d")
-        save_dataframe(df_copy, csv_path, fmt="csv")
-        save_dataframe(df_copy, json_path, fmt="json")
-        return csv_path, json_path
+        if fmt == "parquet":
+            df.to_parquet(data_path, compression="zstd", index=False)
+        else:
+            save_dataframe(df, data_path, fmt="csv", date_format="%Y-%m-%d")
+        save_dataframe(df, json_path, fmt="json", date_format="%Y-%m-%d")
+        return data_path, json_path
     except Exception as e:
         raise IOError(f"Error saving price data to disk: {str(e)}")
+
+
+def load_price_data_from_disk(ticker: str, file_prefix: str) -> pd.DataFrame:
+    """Load price data written by save_price_data_to_disk, preferring the Parquet file.
+
+    Args:
+        ticker (str): Stock ticker symbol.
+        file_prefix (str): Prefix used when saving.
+
+    Returns:
+        pd.DataFrame: The saved price data.
+
+    Raises:
+        FileNotFoundError: If neither a Parquet nor a CSV file exists.
+    """
+    parquet_path = get_output_file_path(ticker, file_prefix, ext="parquet")
+    if os.path.exists(parquet_path) and _parquet_available():
+        return pd.read_parquet(parquet_path)
+    csv_path = get_output_file_path(ticker, file_prefix, ext="csv")
+    if os.path.exists(csv_path):
+        return pd.read_csv(csv_path)
+    raise FileNotFoundError(f"No saved {file_prefix} data for {ticker}")
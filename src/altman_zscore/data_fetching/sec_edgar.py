@@ -4,8 +4,17 @@ SEC EDGAR/XBRL data fetching and parsing utilities for Altman Z-Score analysis.
 Provides helpers for extracting XBRL tag values and fetching company information from SEC EDGAR.
 """
 import logging
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+from altman_zscore.utils.cache import FileCache
+
+# Company info changes rarely; reuse results within a run and across runs for a day
+SEC_EDGAR_CACHE_TTL = timedelta(days=1)
+
+_company_info_cache = FileCache("sec_edgar", SEC_EDGAR_CACHE_TTL)
+
 def find_xbrl_tag(soup, tag_names):
     """Find XBRL tag value from a list of possible tag names in a BeautifulSoup object.
 
@@ -15,9 +24,17 @@ def find_xbrl_tag(soup, tag_names):
 
     Returns:
         float or None: Value of the first matching tag, or None if not found or not convertible.
+
+    Notes:
+        - The document is walked once for all names; ``tag_names`` order still decides
+          which match wins, using the first occurrence of each name.
     """
-    for name in tag_names:
-        tag = soup.find(name.replace(":", "_"))
+    names = [name.replace(":", "_") for name in tag_names]
+    first_by_name = {}
+    for tag in soup.find_all(names):
+        first_by_name.setdefault(tag.name, tag)
+    for name in names:
+        tag = first_by_name.get(name)
         if tag:
             try:
                 return float(tag.text)
@@ -25,6 +42,17 @@ def find_xbrl_tag(soup, tag_names):
                 continue
     return None
 
+@lru_cache(maxsize=1)
+def _sec_client():
+    """Return the SECClient shared by all lookups, created on first use.
+
+    One instance keeps a single request-spacing clock; construction errors (missing
+    User-Agent) are not cached, so a later call retries.
+    """
+    from altman_zscore.api.sec_client import SECClient
+
+    return SECClient()
+
 def fetch_sec_edgar_data(ticker: str) -> Optional[Dict[str, Any]]:
     """Fetch company information from SEC EDGAR for the given ticker.
 
@@ -33,13 +61,22 @@ def fetch_sec_edgar_data(ticker: str) -> Optional[Dict[str, Any]]:
 
     Returns:
         dict or None: Company information if available, else None.
+
+    Notes:
+        - Results are kept per ticker in the "sec_edgar" FileCache (in memory and on disk,
+          SEC_EDGAR_CACHE_TTL); the client still writes company_info.json on each fetch.
+        - Failed lookups are not cached, so a later call retries the request.
+        - All lookups share one SECClient (see _sec_client).
     """
+    key = FileCache.make_key("fetch_sec_edgar_data", ticker.upper())
+    cached = _company_info_cache.get(ticker, key)
+    if cached is not None:
+        return cached
     try:
-        from altman_zscore.api.sec_client import SECClient
-        client = SECClient()
-        company_data = client.get_company_info(ticker, save_to_file=True)
+        company_data = _sec_client().get_company_info(ticker, save_to_file=True)
         if company_data is None:
             return None
+        _company_info_cache.set(ticker, key, company_data)
         return company_data
     except Exception as e:
         logging.warning(f"Failed to fetch SEC EDGAR data for {ticker}: {e}")
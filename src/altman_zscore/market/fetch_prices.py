@@ -8,7 +8,7 @@ using the yfinance API, with retry logic and validation to handle edge cases.
 It supports fetching prices for specific dates, calculating price changes, and saving data.
 
 Functions:
-    get_last_business_day(date_str): Convert a date string to the last business day if it falls on a weekend.
+    get_last_business_day(date_str): Convert a date string to the last business day if it falls on a weekend or holiday.
     get_market_data(ticker, date, days_buffer): Fetch market data for a stock with retry logic and date buffer.
     get_closest_price(df, target_date): Get the closing price closest to the target date.
     get_quarter_price_change(ticker, start, end): Calculate the percentage price change for a stock between two dates.
@@ -18,28 +18,23 @@ Functions:
 
 import json
 import os
-import warnings
-from datetime import datetime, timedelta
-from time import sleep
-import time
 
 import pandas as pd
-import yfinance as yf
 
+from altman_zscore.data_fetching import prices
+from altman_zscore.data_fetching.prices import close_series, download_prices
 from altman_zscore.utils.paths import get_output_dir
 from altman_zscore.utils.logging import get_logger
 from altman_zscore.utils.terminal import print_info, print_warning, print_error, print_success, print_header
 
 logger = get_logger(__name__)
 
-# Filter out yfinance warnings related to auto_adjust changes
-warnings.filterwarnings("ignore", category=UserWarning, module="yfinance")
-warnings.filterwarnings("ignore", message=".*auto_adjust.*")
-
-
 def get_last_business_day(date_str: str) -> str:
     """
-    Convert a date string to the last business day if it falls on a weekend.
+    Convert a date string to the last business day if it falls on a weekend or exchange holiday.
+
+    Delegates to data_fetching.prices.get_last_business_day, which uses the US exchange
+    holiday calendar.
 
     Args:
         date_str (str): Date string in YYYY-MM-DD format.
@@ -48,18 +43,18 @@ def get_last_business_day(date_str: str) -> str:
         str: Adjusted date string representing the last business day.
 
     Raises:
-        ValueError: If the input date string is not in the correct format.
+        ValueError: If the input date string is not in the correct (ISO) format.
     """
-    date = datetime.strptime(date_str, "%Y-%m-%d")
-    while date.weekday() > 4:  # 5 is Saturday, 6 is Sunday
-        date -= timedelta(days=1)
-    return date.strftime("%Y-%m-%d")
+    return prices.get_last_business_day(date_str)
 
 
 def get_market_data(ticker: str, date: str, days_buffer: int = 5) -> pd.DataFrame:
     """
     Fetch market data for a stock with retry logic and date buffer.
 
+    Delegates to data_fetching.prices.get_market_data, so both modules share one cached
+    download path with the same widening and backoff on empty results.
+
     Args:
         ticker (str): Stock symbol.
         date (str): Target date in YYYY-MM-DD format.
@@ -71,44 +66,7 @@ def get_market_data(ticker: str, date: str, days_buffer: int = 5) -> pd.DataFram
     Raises:
         ValueError: If no data is available or if there's an error fetching data.
     """
-    if not isinstance(date, str):
-        raise ValueError("date must be a string in YYYY-MM-DD format")
-    date_obj = datetime.strptime(date, "%Y-%m-%d")
-    start_date = (date_obj - timedelta(days=days_buffer)).strftime("%Y-%m-%d")
-    end_date = (date_obj + timedelta(days=days_buffer)).strftime("%Y-%m-%d")
-
-    df = pd.DataFrame()  # Initialize empty DataFrame
-
-    last_error = None
-
-    for attempt in range(3):
-        try:
-            # Download data
-            df = yf.download(ticker, start=start_date, end=end_date, progress=False)
-
-            # Verify we have valid data
-            if isinstance(df, pd.DataFrame) and not df.empty and len(df.index) > 0:
-                return df
-
-            # If we don't have data and have more attempts, increase buffer
-            if attempt < 2:
-                days_buffer *= 2
-                start_date = (date_obj - timedelta(days=days_buffer)).strftime("%Y-%m-%d")
-                end_date = (date_obj + timedelta(days=days_buffer)).strftime("%Y-%m-%d")
-                time.sleep(2**attempt)  # Exponential backoff
-                continue
-
-        except Exception as e:
-            last_error = str(e)
-            if attempt < 2:
-                time.sleep(2**attempt)  # Exponential backoff
-                continue
-
-    # If we get here, all attempts failed
-    error_msg = f"No market data available for {ticker} around {date}"
-    if last_error:
-        error_msg += f": {last_error}"
-    raise ValueError(error_msg)
+    return prices.get_market_data(ticker, date, days_buffer)
 
 
 def get_closest_price(df: pd.DataFrame, target_date: str) -> float:
@@ -130,18 +88,19 @@ def get_closest_price(df: pd.DataFrame, target_date: str) -> float:
 
     try:
         # Convert target date to datetime
-        target = pd.to_datetime(target_date)
-
-        # Find the closest date using pandas date index
-        closest_idx = df.index.get_indexer([target], method="nearest")[0]
+        target = pd.Timestamp(target_date)
+        index = df.index
+        if getattr(index, "tz", None) is not None and target.tz is None:
+            target = target.tz_localize(index.tz)
 
-        # Since yfinance now uses auto_adjust=True by default, we use Adj Close
-        close_col = "Adj Close" if "Adj Close" in df.columns else "Close"
-        if close_col not in df.columns:
-            raise ValueError("Neither 'Close' nor 'Adj Close' column found in data")
+        # Binary search the sorted date index, then step back if the previous bar is strictly nearer
+        closest_idx = int(index.searchsorted(target))
+        if closest_idx == len(index):
+            closest_idx -= 1
+        elif closest_idx > 0 and target - index[closest_idx - 1] < index[closest_idx] - target:
+            closest_idx -= 1
 
-        price = df[close_col].iloc[closest_idx]  # Get scalar value
-        return float(price)  # Convert to native Python float
+        return float(close_series(df).iat[closest_idx])  # Convert to native Python float
 
     except Exception as e:
         raise ValueError(f"Error getting closest price: {str(e)}")
@@ -151,6 +110,9 @@ def get_quarter_price_change(ticker: str, start: str, end: str) -> float:
     """
     Calculate the percentage price change for a stock between two dates.
 
+    Delegates to data_fetching.prices.get_quarter_price_change, which reads both prices
+    from one cached window spanning the two dates.
+
     Args:
         ticker (str): Stock symbol.
         start (str): Start date in YYYY-MM-DD format.
@@ -162,21 +124,7 @@ def get_quarter_price_change(ticker: str, start: str, end: str) -> float:
     Raises:
         ValueError: If no data is available or if there's an error calculating the price change.
     """
-    # Adjust for weekends
-    start = get_last_business_day(start)
-    end = get_last_business_day(end)
-
-    try:
-        # Get market data with a wider range to ensure we have data
-        df = get_market_data(ticker, start, days_buffer=10)
-
-        # Get closest prices to start and end dates
-        start_price = get_closest_price(df, start)
-        end_price = get_closest_price(df, end)
-
-        return (end_price - start_price) / start_price * 100
-    except Exception as e:
-        raise ValueError(f"Error calculating price change for {ticker}: {str(e)}")
+    return prices.get_quarter_price_change(ticker, start, end)
 
 
 def get_start_end_prices(ticker: str, start_date: str, end_date: str) -> tuple[float, float]:
@@ -194,21 +142,14 @@ def get_start_end_prices(ticker: str, start_date: str, end_date: str) -> tuple[f
     Raises:
         ValueError: If no data is available or if there's an error accessing price data.
     """
-    df = yf.download(ticker, start=start_date, end=end_date, progress=False)
+    df = download_prices(ticker, start_date, end_date)
 
     if df is None or df.empty:
         raise ValueError(f"No price data available for {ticker}")
 
     try:
-        # Since yfinance now uses auto_adjust=True by default, we use Adj Close
-        close_col = "Adj Close" if "Adj Close" in df.columns else "Close"
-        if close_col not in df.columns:
-            raise ValueError("Neither 'Close' nor 'Adj Close' column found in data")
-            # Use float(ser.iloc[0]) to avoid FutureWarning
-        # and ensure type safety
-        start_price = float(df[close_col].iloc[0])
-        end_price = float(df[close_col].iloc[-1])
-        return start_price, end_price
+        closes = close_series(df).to_numpy()
+        return float(closes[0]), float(closes[-1])
     except (IndexError, KeyError) as e:
         raise ValueError(f"Error accessing price data for {ticker}: {str(e)}")
 
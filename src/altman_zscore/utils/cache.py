@@ -0,0 +1,184 @@
+"""
+On-disk TTL cache for fetched DataFrames in Altman Z-Score analysis.
+
+Stores each cached frame (or other picklable payload) under output/.cache/<namespace>/<TICKER>/<key>.pkl with a sibling
+<key>.json holding {"timestamp": ..., "ttl_seconds": ...}, so repeated analyses for the same
+request are served from disk instead of the network. Recently used entries are also kept in
+memory, so repeat lookups within one process skip the unpickle.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from altman_zscore.utils.paths import get_output_dir
+
+logger = logging.getLogger(__name__)
+
+# Entries kept in memory per FileCache; the oldest is evicted first
+MEMORY_CACHE_MAX_ENTRIES = 256
+
+
+class FileCache:
+    """File-backed DataFrame cache with per-entry expiry.
+
+    Entries are pickled, so any picklable value can be stored; the ``cached`` decorator
+    only ever stores non-empty DataFrames.
+
+    Args:
+        namespace (str): Subdirectory of output/.cache/ for this cache (e.g. 'prices').
+        ttl (timedelta): How long an entry stays valid after it is written.
+    """
+
+    def __init__(self, namespace: str, ttl: timedelta):
+        self.namespace = namespace
+        self.ttl_seconds = ttl.total_seconds()
+        self._memory: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._purged = False
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Return a stable hex key for the given request parts."""
+        return hashlib.md5("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+    def _paths(self, ticker: str, key: str) -> tuple[str, str]:
+        base = get_output_dir(os.path.join(".cache", self.namespace, ticker.upper()))
+        return os.path.join(base, f"{key}.pkl"), os.path.join(base, f"{key}.json")
+
+    def _remember(self, ticker: str, key: str, expires_at: float, df: Any) -> None:
+        with self._lock:
+            self._memory.pop((ticker.upper(), key), None)
+            self._memory[(ticker.upper(), key)] = (expires_at, df)
+            if len(self._memory) > MEMORY_CACHE_MAX_ENTRIES:
+                del self._memory[next(iter(self._memory))]
+
+    @staticmethod
+    def _detach(value: Any) -> Any:
+        """Shallow-copy frames and series so callers reshaping a hit do not alter the cached entry."""
+        return value.copy(deep=False) if isinstance(value, (pd.DataFrame, pd.Series)) else value
+
+    def get(self, ticker: str, key: str) -> Optional[Any]:
+        """Return the cached frame, or None if it is missing, expired, or unreadable.
+
+        DataFrame and Series hits are returned as shallow copies of the remembered entry.
+        """
+        if not self._purged:
+            self.purge_expired()
+        entry = self._memory.get((ticker.upper(), key))
+        if entry is not None and entry[0] > time.time():
+            return self._detach(entry[1])
+        data_path, meta_path = self._paths(ticker, key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            expires_at = float(meta["timestamp"]) + float(meta.get("ttl_seconds", self.ttl_seconds))
+            if time.time() > expires_at:
+                return None
+            df = pd.read_pickle(data_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable {self.namespace} cache entry for {ticker}: {e}")
+            return None
+        self._remember(ticker, key, expires_at, df)
+        return self._detach(df)
+
+    def set(self, ticker: str, key: str, df: Any, ttl: Optional[timedelta] = None) -> None:
+        """Store a frame; failures are logged and never raised.
+
+        ``ttl`` overrides the cache-wide lifetime for this entry only.
+        """
+        data_path, meta_path = self._paths(ticker, key)
+        ttl_seconds = ttl.total_seconds() if ttl is not None else self.ttl_seconds
+        now = time.time()
+        self._remember(ticker, key, now + ttl_seconds, df)
+        try:
+            pd.to_pickle(df, data_path)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"timestamp": now, "ttl_seconds": ttl_seconds}, f)
+        except Exception as e:
+            logger.warning(f"Could not write {self.namespace} cache entry for {ticker}: {e}")
+
+    def purge_expired(self) -> int:
+        """Delete expired entries of this namespace from disk.
+
+        Runs automatically on the first lookup in each process.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        self._purged = True
+        root = os.path.join(get_output_dir(), ".cache", self.namespace)
+        removed = 0
+        now = time.time()
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                if not name.endswith(".json"):
+                    continue
+                meta_path = os.path.join(dirpath, name)
+                try:
+                    with open(meta_path, "r", encoding="utf-8") as f:
+                        meta = json.load(f)
+                    if now - float(meta["timestamp"]) <= float(meta.get("ttl_seconds", self.ttl_seconds)):
+                        continue
+                    os.remove(meta_path)
+                    data_path = meta_path[: -len(".json")] + ".pkl"
+                    if os.path.exists(data_path):
+                        os.remove(data_path)
+                    removed += 1
+                except Exception as e:
+                    logger.debug(f"Skipping {meta_path} while purging {self.namespace} cache: {e}")
+        return removed
+
+
+def cached(
+    namespace: str, ttl: timedelta, ttl_for: Optional[Callable[..., Optional[timedelta]]] = None
+) -> Callable:
+    """Decorator caching a ``func(ticker, *args, **kwargs) -> DataFrame`` in a FileCache.
+
+    The key is built from every argument. Empty or non-DataFrame results are not cached.
+    Callers can pass ``force_refresh=True`` to bypass and overwrite the cached entry.
+    The wrapper exposes ``.cache`` and ``.cache_key(ticker, *args, **kwargs)`` so batch
+    fetchers can read and fill the same entries.
+
+    Args:
+        namespace (str): Cache namespace (subdirectory).
+        ttl (timedelta): Entry lifetime.
+        ttl_for (Callable, optional): Called with the wrapped call's arguments; a non-None
+            result overrides ``ttl`` for that entry (e.g. shorter lifetimes for recent data).
+
+    Returns:
+        Callable: Decorator.
+    """
+    cache = FileCache(namespace, ttl)
+
+    def decorator(func: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+        def cache_key(ticker: str, *args, **kwargs) -> str:
+            return FileCache.make_key(func.__name__, ticker.upper(), *args, *sorted(kwargs.items()))
+
+        @functools.wraps(func)
+        def wrapper(ticker: str, *args, force_refresh: bool = False, **kwargs) -> pd.DataFrame:
+            key = cache_key(ticker, *args, **kwargs)
+            if not force_refresh:
+                hit = cache.get(ticker, key)
+                if hit is not None:
+                    return hit
+            df = func(ticker, *args, **kwargs)
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                cache.set(ticker, key, df, ttl=ttl_for(ticker, *args, **kwargs) if ttl_for else None)
+            return df
+
+        wrapper.cache = cache
+        wrapper.cache_key = cache_key
+        return wrapper
+
+    return decorator
@@ -2,14 +2,21 @@
 I/O utilities for Altman Z-Score analysis.
 
 Centralizes DataFrame-to-file logic and output file naming for DRY compliance.
-Provides functions for constructing output file paths and saving DataFrames to disk.
+Provides functions for constructing output file paths and saving DataFrames and JSON payloads to disk.
 """
 
 import os
+import json
+import math
 import pandas as pd
-from typing import Optional, Literal
+from typing import Any, Iterable, Optional, Literal
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib json encoder is used without it
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 def get_output_file_path(ticker: str, basename: str, ext: str = "csv", subdir: Optional[str] = None) -> str:
@@ -36,7 +43,8 @@ def save_dataframe(
     path: str,
     fmt: Optional[str] = None,
     orient: Literal["split", "records", "index", "columns", "values", "table"] = "records",
-    indent: int = 2
+    indent: int = 2,
+    date_format: Optional[str] = None,
 ) -> None:
     """Save a DataFrame to CSV or JSON with pretty formatting and error handling.
 
@@ -46,6 +54,8 @@ def save_dataframe(
         fmt (str, optional): File format ('csv' or 'json'). If None, inferred from file extension.
         orient (str, optional): JSON orientation (if saving as JSON).
         indent (int, optional): Indentation for JSON output.
+        date_format (str, optional): strftime format for datetime columns. Applied by the CSV
+            writer directly; for JSON only the datetime columns are formatted, on a shallow copy.
 
     Raises:
         ValueError: If the file format is unsupported.
@@ -54,19 +64,105 @@ def save_dataframe(
     fmt = fmt or os.path.splitext(path)[1][1:].lower()
     try:
         if fmt == "csv":
-            df.to_csv(path, index=False)
+            df.to_csv(path, index=False, date_format=date_format)
         elif fmt == "json":
-            # Only pass indent if pandas version supports it (>=1.0.0)
-            import pandas as pd
-            import inspect
-            to_json_sig = inspect.signature(pd.DataFrame.to_json)
-            if "indent" in to_json_sig.parameters:
-                df.to_json(path, orient=orient, indent=indent)
-            else:
-                df.to_json(path, orient=orient)
+            if date_format:
+                datetime_cols = df.select_dtypes(include=["datetime", "datetimetz"]).columns
+                if len(datetime_cols):
+                    # Shallow copy: only the formatted columns are new, the rest stay shared with the caller's frame
+                    df = df.copy(deep=False)
+                    df[datetime_cols] = df[datetime_cols].apply(lambda s: s.dt.strftime(date_format))
+            # pandas (>=2.2, see requirements.txt) writes indented JSON straight to the file
+            df.to_json(path, orient=orient, indent=indent)
         else:
             logger.error(f"Unsupported file format: {fmt}")
             raise ValueError(f"Unsupported file format: {fmt}")
     except Exception as e:
         logger.error(f"Could not save DataFrame to {path}: {e}")
         raise RuntimeError(f"Could not save DataFrame to {path}: {e}")
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _ORJSON_LINE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+
+def _null_non_finite(obj: Any) -> Any:
+    """Replace NaN/inf floats with None, as orjson does, so the stdlib encoder emits valid JSON."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _null_non_finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_null_non_finite(v) for v in obj]
+    return obj
+
+
+def dump_json_bytes(obj: Any) -> bytes:
+    """Serialize an object to indented UTF-8 JSON bytes.
+
+    Uses orjson; values it cannot encode natively (Decimal, pandas Timestamps, ...)
+    are stringified. Falls back to the stdlib encoder for payloads orjson rejects,
+    such as dicts keyed by pandas Timestamps, and when orjson is not installed;
+    either way NaN and infinity are written as null.
+
+    Args:
+        obj (Any): JSON-compatible object.
+
+    Returns:
+        bytes: Encoded JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS, default=str)
+        except TypeError:
+            pass
+    return json.dumps(_null_non_finite(obj), indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def save_json(obj: Any, path: str) -> None:
+    """Write an object to a JSON file with a single write call.
+
+    Args:
+        obj (Any): JSON-compatible object.
+        path (str): Output file path.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    with open(path, "wb") as f:
+        f.write(dump_json_bytes(obj))
+
+
+def _dump_json_line(record: Any) -> bytes:
+    """Encode one NDJSON line, using orjson when available (see dump_json_bytes)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=_ORJSON_LINE_OPTIONS, default=str)
+        except TypeError:
+            pass
+    return json.dumps(_null_non_finite(record), ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+
+
+def save_ndjson(records: Iterable[Any], path: str) -> int:
+    """Stream records to a newline-delimited JSON (NDJSON) file, one record per line.
+
+    Records are encoded and written one at a time, so the input can be a generator and
+    memory stays flat regardless of how many records are written. Load the result with
+    ``pd.read_json(path, lines=True)``.
+
+    Args:
+        records (Iterable[Any]): JSON-compatible records.
+        path (str): Output file path.
+
+    Returns:
+        int: Number of records written.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    count = 0
+    with open(path, "wb") as f:
+        for record in records:
+            f.write(_dump_json_line(record))
+            count += 1
+    return count
@@ -13,6 +13,10 @@ Classes:
 """
 
 from enum import Enum
+
+import numpy as np
+import pandas as pd
+
 from altman_zscore.computation.constants import (
     ERROR_MSG_ALL_FIELDS_MISSING,
     ERROR_MSG_MISSING_FIELD,
@@ -22,6 +26,17 @@ from altman_zscore.computation.constants import (
 )
 
 
+def _as_float(value):
+    """Return a float-compatible number; floats and ints skip the float() conversion.
+
+    Fetchers may hand in Decimals, which cannot be mixed with floats in arithmetic.
+    """
+    kind = type(value)
+    if kind is float or kind is int:
+        return value
+    return float(value)
+
+
 class ValidationLevel(Enum):
     """
     Enum for severity level of validation issues.
@@ -30,6 +45,11 @@ class ValidationLevel(Enum):
     WARNING = "WARNING"
 
 
+# Enum member lookups go through the metaclass; the hot paths use these module globals
+_ERROR = ValidationLevel.ERROR
+_WARNING = ValidationLevel.WARNING
+
+
 class ValidationIssue:
     """
     Represents a validation issue for a field in financial data.
@@ -42,6 +62,9 @@ class ValidationIssue:
         expected_range (Any, optional): Expected value range (if applicable).
     """
 
+    # Created per check per quarter; slots drop the per-instance __dict__
+    __slots__ = ("field", "issue", "level", "value", "expected_range")
+
     def __init__(self, field, issue, level, value=None, expected_range=None):
         self.field = field
         self.issue = issue
@@ -56,6 +79,8 @@ class FinancialDataValidator:
 
     Methods:
         validate(q, industry=None): Validate a single quarter's data.
+        validate_many(quarters, industry=None): Validate many quarters with vectorized checks.
+        validate_batch(df, industry=None): Validate every row of a DataFrame with vectorized checks.
         validate_data(q, industry=None): Alias for validate.
         summarize_issues(issues): Summarize validation issues for diagnostics/reporting.
         check_consistency(q): Run consistency checks for financial data.
@@ -70,6 +95,16 @@ class FinancialDataValidator:
         "sales",
     ]
 
+    # (field, missing-field message) per required field, formatted once instead of per quarter
+    _REQUIRED_FIELD_MESSAGES = tuple(
+        (field, ERROR_MSG_MISSING_FIELD.format(field=field)) for field in REQUIRED_FIELDS
+    )
+    # Column layout of the validate_batch matrix and the positions its checks read
+    _BATCH_COLUMNS = [*REQUIRED_FIELDS, "total_liabilities"]
+    _TOTAL_ASSETS_COL = _BATCH_COLUMNS.index("total_assets")
+    _SALES_COL = _BATCH_COLUMNS.index("sales")
+    _LIABILITIES_COL = _BATCH_COLUMNS.index("total_liabilities")
+
     def validate(self, q, industry=None):
         """
         Validate a single quarter's financial data for required fields, missing values, and suspicious values.
@@ -81,59 +116,158 @@ class FinancialDataValidator:
             list: List of ValidationIssue (warnings/errors).
         """
         issues = []
-        # 1. Required field check
-        for field in self.REQUIRED_FIELDS:
-            if field not in q or q[field] is None:
-                issues.append(
-                    ValidationIssue(
-                        field=field,
-                        issue=ERROR_MSG_MISSING_FIELD.format(field=field),
-                        level=ValidationLevel.ERROR,
-                    )
-                )
+        append = issues.append
+        get = q.get
+        # 1. Required field check, noting in the same pass whether any field is populated
+        populated = False
+        for field, message in self._REQUIRED_FIELD_MESSAGES:
+            value = get(field)
+            if value is None:
+                append(ValidationIssue(field=field, issue=message, level=_ERROR))
+            elif not populated and value not in ("", 0.0):
+                populated = True
         # 2. All-zero or all-missing check (edge case: empty quarter)
-        nonzero_fields = [f for f in self.REQUIRED_FIELDS if q.get(f) not in (None, "", 0.0)]
-        if len(nonzero_fields) == 0:
-            issues.append(
+        if not populated:
+            append(
                 ValidationIssue(
                     field=None,
                     issue=ERROR_MSG_ALL_FIELDS_MISSING,
-                    level=ValidationLevel.ERROR,
+                    level=_ERROR,
                 )
             )
         # 3. Suspicious value checks (edge cases)
-        if q.get("total_assets") is not None and q["total_assets"] < 0:
-            issues.append(
+        total_assets = get("total_assets")
+        sales = get("sales")
+        if total_assets is not None and total_assets < 0:
+            append(
                 ValidationIssue(
                     field="total_assets",
                     issue=ERROR_MSG_NEGATIVE_ASSETS,
-                    level=ValidationLevel.WARNING,
-                    value=q["total_assets"],
+                    level=_WARNING,
+                    value=total_assets,
                 )
             )
-        if q.get("sales") is not None and q["sales"] < 0:
-            issues.append(
+        if sales is not None and sales < 0:
+            append(
                 ValidationIssue(
                     field="sales",
                     issue=ERROR_MSG_NEGATIVE_SALES,
-                    level=ValidationLevel.WARNING,
-                    value=q["sales"],
+                    level=_WARNING,
+                    value=sales,
                 )
             )
         # 4. Extreme ratio checks (e.g., liabilities > 10x assets)
-        if q.get("total_liabilities") is not None and q.get("total_assets") not in (None, 0.0):
-            ratio = q["total_liabilities"] / q["total_assets"]
+        total_liabilities = get("total_liabilities")
+        if total_liabilities is not None and total_assets not in (None, 0.0):
+            ratio = _as_float(total_liabilities) / _as_float(total_assets)
             if ratio > 10:
-                issues.append(
+                append(
                     ValidationIssue(
                         field="total_liabilities",
                         issue=ERROR_MSG_LIABILITIES_RATIO,
-                        level=ValidationLevel.WARNING,
+                        level=_WARNING,
                         value=ratio,
                     )
                 )
         return issues
 
+    def validate_many(self, quarters, industry=None):
+        """
+        Validate many quarters at once; same checks and issue order as validate().
+
+        The quarters are stacked into one DataFrame and checked with validate_batch(),
+        so bulk validation avoids per-quarter dict lookups. Unlike validate(), NaN values
+        count as missing (they are indistinguishable from None once stacked), as do
+        non-numeric values.
+
+        Args:
+            quarters (list): Financial data dicts, one per quarter.
+            industry (str, optional): Industry string for context.
+        Returns:
+            list: One list of ValidationIssue per quarter, in input order.
+        """
+        if not quarters:
+            return []
+        frame = pd.DataFrame.from_records(quarters, columns=self._BATCH_COLUMNS)
+        return self.validate_batch(frame, industry)
+
+    def validate_batch(self, df, industry=None):
+        """
+        Validate every row of a DataFrame with vectorized checks (see validate_many).
+
+        Each check is one NumPy comparison over a whole column; ValidationIssue objects
+        are only built for the violating rows. Columns named after REQUIRED_FIELDS and
+        total_liabilities are used, and absent columns count as missing.
+
+        Args:
+            df (pd.DataFrame): One row per quarter (or company); the index is ignored.
+            industry (str, optional): Industry string for context.
+        Returns:
+            list: One list of ValidationIssue per row, in row order.
+        """
+        if df.empty:
+            return []
+        fields = self.REQUIRED_FIELDS
+        frame = df.reindex(columns=self._BATCH_COLUMNS)
+        # One contiguous (rows x columns) float64 matrix; only frames holding non-numeric
+        # values pay for the per-column pd.to_numeric coercion
+        try:
+            values = frame.to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError):
+            values = frame.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        required = values[:, : len(fields)]
+        missing = np.isnan(required)
+        empty = (missing | (required == 0)).all(axis=1)
+        total_assets = values[:, self._TOTAL_ASSETS_COL]
+        sales = values[:, self._SALES_COL]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = values[:, self._LIABILITIES_COL] / np.where(total_assets == 0, np.nan, total_assets)
+
+        negative_assets = total_assets < 0
+        negative_sales = sales < 0
+        high_ratio = ratio > 10
+
+        issues = [[] for _ in range(len(frame))]
+        # Most batches are clean: one combined mask (NaN compares False) skips the per-check walks
+        if not (empty | missing.any(axis=1) | negative_assets | negative_sales | high_ratio).any():
+            return issues
+        # np.nonzero walks row-major, so each quarter's fields keep REQUIRED_FIELDS order
+        for row, col in zip(*np.nonzero(missing)):
+            field, message = self._REQUIRED_FIELD_MESSAGES[col]
+            issues[row].append(ValidationIssue(field=field, issue=message, level=_ERROR))
+        for row in np.flatnonzero(empty):
+            issues[row].append(
+                ValidationIssue(field=None, issue=ERROR_MSG_ALL_FIELDS_MISSING, level=_ERROR)
+            )
+        for row in np.flatnonzero(negative_assets):
+            issues[row].append(
+                ValidationIssue(
+                    field="total_assets",
+                    issue=ERROR_MSG_NEGATIVE_ASSETS,
+                    level=_WARNING,
+                    value=frame["total_assets"].iat[row],
+                )
+            )
+        for row in np.flatnonzero(negative_sales):
+            issues[row].append(
+                ValidationIssue(
+                    field="sales",
+                    issue=ERROR_MSG_NEGATIVE_SALES,
+                    level=_WARNING,
+                    value=frame["sales"].iat[row],
+                )
+            )
+        for row in np.flatnonzero(high_ratio):
+            issues[row].append(
+                ValidationIssue(
+                    field="total_liabilities",
+                    issue=ERROR_MSG_LIABILITIES_RATIO,
+                    level=_WARNING,
+                    value=float(ratio[row]),
+                )
+            )
+        return issues
+
     def validate_data(self, q, industry=None):
         """
         Alias for validate().
@@ -159,10 +293,12 @@ class FinancialDataValidator:
             return "No validation issues."
         lines = []
         for i in issues:
-            prefix = "[ERROR]" if i.level == ValidationLevel.ERROR else "[WARN]"
-            field = f"{i.field}: " if i.field else ""
-            val = f" (value: {i.value})" if hasattr(i, "value") and i.value is not None else ""
-            lines.append(f"{prefix} {field}{i.issue}{val}")
+            # Build each line with one format; the value suffix only when there is a value
+            prefix = "[ERROR] " if i.level is _ERROR else "[WARN] "
+            if i.field:
+                prefix = f"{prefix}{i.field}: "
+            value = getattr(i, "value", None)
+            lines.append(f"{prefix}{i.issue}" if value is None else f"{prefix}{i.issue} (value: {value})")
         return " | ".join(lines)
 
     def check_consistency(self, q):
@@ -186,7 +322,7 @@ class FinancialDataValidator:
             issues.append(ValidationIssue(
                 field="total_assets/current_assets",
                 issue="Total Assets < Current Assets — check tags for TA or CA",
-                level=ValidationLevel.WARNING,
+                level=_WARNING,
                 value=f"TA={ta}, CA={ca}"
             ))
         # TL >= CL
@@ -196,7 +332,7 @@ class FinancialDataValidator:
             issues.append(ValidationIssue(
                 field="total_liabilities/current_liabilities",
                 issue="Total Liabilities < Current Liabilities — check tags for TL or CL",
-                level=ValidationLevel.WARNING,
+                level=_WARNING,
                 value=f"TL={tl}, CL={cl}"
             ))
         # BVE ≈ TA - TL
@@ -207,7 +343,7 @@ class FinancialDataValidator:
                 issues.append(ValidationIssue(
                     field="book_value_equity",
                     issue="Shareholders’ Equity mismatch: BVE vs. TA - TL",
-                    level=ValidationLevel.WARNING,
+                    level=_WARNING,
                     value=f"BVE={bve}, TA-TL={ta-tl}, Diff={equity_diff}"
                 ))
         # Rounding discrepancies (if raw and rounded available)
@@ -10,3 +10,294 @@ def test_financials_core_import():
 
 def test_executives_import():
     import altman_zscore.data_fetching.executives
+
+def test_fetch_sec_edgar_data_uses_disk_cache(tmp_path, monkeypatch):
+    from altman_zscore.api import sec_client
+    from altman_zscore.data_fetching import sec_edgar
+    from altman_zscore.utils.cache import FileCache
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sec_edgar, "_company_info_cache", FileCache("sec_edgar", sec_edgar.SEC_EDGAR_CACHE_TTL))
+    calls = []
+
+    class FakeClient:
+        def get_company_info(self, ticker, save_to_file=False):
+            calls.append(ticker)
+            return {"cik": "0000000001"}
+
+    monkeypatch.setattr(sec_client, "SECClient", FakeClient)
+    sec_edgar._sec_client.cache_clear()
+    try:
+        assert sec_edgar.fetch_sec_edgar_data("TEST") == {"cik": "0000000001"}
+        # A fresh cache object has nothing in memory, so this hit comes from disk
+        monkeypatch.setattr(sec_edgar, "_company_info_cache", FileCache("sec_edgar", sec_edgar.SEC_EDGAR_CACHE_TTL))
+        assert sec_edgar.fetch_sec_edgar_data("TEST") == {"cik": "0000000001"}
+        assert calls == ["TEST"]
+    finally:
+        sec_edgar._sec_client.cache_clear()
+
+def test_fetch_yfinance_full_is_served_from_file_cache(tmp_path, monkeypatch):
+    import os
+    from altman_zscore.api import yahoo_helpers
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_fetch(ticker):
+        calls.append(ticker)
+        return {"info": {"symbol": ticker}} if ticker != "FAIL" else None
+
+    monkeypatch.setattr(yahoo_helpers, "_fetch_yfinance_full_uncached", fake_fetch)
+    assert yahoo_helpers.fetch_yfinance_full("YFC") == {"info": {"symbol": "YFC"}}
+    assert yahoo_helpers.fetch_yfinance_full("YFC") == {"info": {"symbol": "YFC"}}
+    assert yahoo_helpers.fetch_yfinance_full("FAIL") is None
+    assert yahoo_helpers.fetch_yfinance_full("FAIL") is None
+    assert calls == ["YFC", "FAIL", "FAIL"]
+    assert any(name.endswith(".pkl") for name in os.listdir(tmp_path / "output" / ".cache" / "yf_full" / "YFC"))
+
+
+def test_fetch_sec_edgar_data_reuses_one_client(tmp_path, monkeypatch):
+    from altman_zscore.api import sec_client
+    from altman_zscore.data_fetching import sec_edgar
+    from altman_zscore.utils.cache import FileCache
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sec_edgar, "_company_info_cache", FileCache("sec_edgar", sec_edgar.SEC_EDGAR_CACHE_TTL))
+    created = []
+
+    class FakeClient:
+        def __init__(self):
+            created.append(self)
+
+        def get_company_info(self, ticker, save_to_file=False):
+            return {"ticker": ticker}
+
+    monkeypatch.setattr(sec_client, "SECClient", FakeClient)
+    sec_edgar._sec_client.cache_clear()
+    try:
+        assert sec_edgar.fetch_sec_edgar_data("AAA") == {"ticker": "AAA"}
+        assert sec_edgar.fetch_sec_edgar_data("BBB") == {"ticker": "BBB"}
+        assert sec_edgar.fetch_sec_edgar_data("AAA") == {"ticker": "AAA"}
+        assert len(created) == 1
+    finally:
+        sec_edgar._sec_client.cache_clear()
+
+def test_find_xbrl_tag_prefers_tag_name_order_over_document_order():
+    from bs4 import BeautifulSoup
+    from altman_zscore.data_fetching.sec_edgar import find_xbrl_tag
+    soup = BeautifulSoup(
+        "<xbrl><us-gaap_Revenues>n/a</us-gaap_Revenues><us-gaap_SalesRevenueNet>5</us-gaap_SalesRevenueNet>"
+        "<us-gaap_Revenues>9</us-gaap_Revenues><us-gaap_Assets>7</us-gaap_Assets></xbrl>",
+        "xml",
+    )
+    assert find_xbrl_tag(soup, ["us-gaap:Assets", "us-gaap:Revenues"]) == 7.0
+    assert find_xbrl_tag(soup, ["us-gaap:Revenues", "us-gaap:SalesRevenueNet"]) == 5.0
+    assert find_xbrl_tag(soup, ["us-gaap:Missing"]) is None
+
+def test_find_matching_field_exact_case_insensitive_and_synonym():
+    from altman_zscore.data_fetching.financials_core import find_matching_field
+    available = ("Total Assets", "operating income", "Retained Earnings")
+    assert find_matching_field("Total Assets", available) == "Total Assets"
+    assert find_matching_field("retained earnings", available) == "Retained Earnings"
+    assert find_matching_field("ebit", available) == "operating income"
+    assert find_matching_field("sales", available) is None
+    assert find_matching_field(None, available) is None
+
+def test_save_ndjson_streams_one_record_per_line(tmp_path):
+    from decimal import Decimal
+    import pandas as pd
+    from altman_zscore.utils.io import save_ndjson
+    path = tmp_path / "quarters.ndjson"
+    records = ({"period_end": f"2024-0{i}-30", "sales": float(i), "ebit": Decimal("1.5")} for i in range(1, 4))
+    assert save_ndjson(records, str(path)) == 3
+    df = pd.read_json(path, lines=True)
+    assert list(df["sales"]) == [1.0, 2.0, 3.0]
+
+def test_json_helpers_fall_back_to_stdlib_without_orjson(tmp_path, monkeypatch):
+    import json
+    from decimal import Decimal
+    from altman_zscore.utils import io
+    monkeypatch.setattr(io, "orjson", None)
+    assert json.loads(io.dump_json_bytes({"ebit": Decimal("1.5"), "n": 2})) == {"ebit": "1.5", "n": 2}
+    path = tmp_path / "rows.ndjson"
+    assert io.save_ndjson([{"a": 1}, {"a": 2}], str(path)) == 2
+    assert path.read_text(encoding="utf-8").splitlines() == ['{"a": 1}', '{"a": 2}']
+    nan, inf = float("nan"), float("inf")
+    assert json.loads(io.dump_json_bytes({"x": nan, "rows": [(inf, 1.0)]})) == {"x": None, "rows": [[None, 1.0]]}
+    assert io.save_ndjson([{"a": -inf}], str(path)) == 1
+    assert path.read_text(encoding="utf-8") == '{"a": null}\n'
+
+def test_find_matching_field_accepts_prebuilt_field_index():
+    from altman_zscore.data_fetching.financials_core import FieldIndex, find_matching_field
+    idx = FieldIndex(["Total Revenue", "EBIT"])
+    assert "EBIT" in idx and len(idx) == 2
+    assert find_matching_field("total revenue", idx) == "Total Revenue"
+    assert find_matching_field("sales", idx) == "Total Revenue"
+
+
+def test_df_to_dict_str_keys_float_default_and_decimal_opt_in():
+    from decimal import Decimal
+    import pandas as pd
+    from altman_zscore.data_fetching.financials_core import df_to_dict_str_keys
+    df = pd.DataFrame({pd.Timestamp("2024-03-31"): [1.5, None]}, index=["Total Assets", "EBIT"])
+    assert df_to_dict_str_keys(df) == {"2024-03-31 00:00:00": {"Total Assets": 1.5, "EBIT": 0.0}}
+    exact = df_to_dict_str_keys(df, value_type=Decimal)
+    assert exact["2024-03-31 00:00:00"]["Total Assets"] == Decimal("1.5")
+
+
+def test_save_statements_json_keeps_str_timestamp_period_keys(tmp_path):
+    import json
+    import pandas as pd
+    from altman_zscore.data_fetching.financials import _save_statements_json
+    df = pd.DataFrame({pd.Timestamp("2024-03-31"): [1.5, None]}, index=["Total Assets", "EBIT"])
+    path = tmp_path / "financials_raw.json"
+    _save_statements_json({"balance_sheet": df, "income_statement": None}, path)
+    assert json.loads(path.read_text(encoding="utf-8")) == {
+        "balance_sheet": {"2024-03-31 00:00:00": {"Total Assets": 1.5, "EBIT": None}},
+        "income_statement": {},
+    }
+
+
+def _fake_yfinance_statements():
+    import pandas as pd
+    periods = pd.to_datetime(["2024-03-31", "2023-12-31"])
+    bs = pd.DataFrame(
+        {
+            periods[0]: [100.0, 40.0, 30.0, 60.0, 0.0, 50.0],
+            periods[1]: [90.0, 35.0, 25.0, 55.0, 5.0, 0.0],
+        },
+        index=["Total Assets", "Current Assets", "Current Liabilities", "Stockholders Equity",
+               "Additional Paid In Capital", "Total Liabilities Net Minority Interest"],
+    )
+    is_ = pd.DataFrame({periods[0]: [80.0, 9.0], periods[1]: [70.0, 8.0]}, index=["Total Revenue", "EBIT"])
+    return {"info": {}, "balance_sheet": bs, "income_statement": is_}
+
+
+def test_fetch_financials_yfinance_inferred_field_keeps_zero_paid_in_capital(tmp_path, monkeypatch):
+    from altman_zscore.api import sec_client
+    from altman_zscore.data_fetching import financials
+    monkeypatch.chdir(tmp_path)
+
+    class NoCikClient:
+        def lookup_cik(self, ticker):
+            return None
+
+    class FakeAIClient:
+        def suggest_field_mapping(self, raw_fields, fields, sample_values):
+            return {
+                "total_assets": "Total Assets",
+                "current_assets": "Current Assets",
+                "current_liabilities": "Current Liabilities",
+                "retained_earnings": "INFERRED:Stockholders Equity:Additional Paid In Capital",
+                "total_liabilities": {"FoundField": "Total Liabilities Net Minority Interest"},
+                "ebit": "EBIT",
+                "sales": "Total Revenue",
+            }
+
+    monkeypatch.setattr(sec_client, "SECClient", NoCikClient)
+    monkeypatch.setattr(financials, "AzureOpenAIClient", FakeAIClient)
+    monkeypatch.setattr(financials, "fetch_yfinance_full", lambda ticker: _fake_yfinance_statements())
+    result = financials.fetch_financials("TEST", "2024-03-31", "original")
+    older, latest = result["quarters"]
+    assert (older["period_end"], latest["period_end"]) == ("2023-12-31", "2024-03-31")
+    assert latest["retained_earnings"] == 60.0
+    assert latest["field_mapping"]["retained_earnings"] == "Inferred from Stockholders Equity minus Additional Paid In Capital"
+    assert older["retained_earnings"] == 50.0
+    # A zero direct cell is still reported missing, as before
+    assert "total_liabilities" not in older
+    assert result["missing_fields_by_quarter"] == [["total_liabilities", "market_value_equity"], ["market_value_equity"]]
+
+
+def test_fetch_financials_pivots_sec_company_facts(tmp_path, monkeypatch):
+    from altman_zscore.api import sec_client
+    from altman_zscore.data_fetching import financials
+    monkeypatch.chdir(tmp_path)
+
+    def concept(*entries):
+        return {"units": {"USD": [{"end": end, "val": val} for end, val in entries]}}
+
+    facts = {
+        "facts": {
+            "us-gaap": {
+                # The 2024-03-31 total is filed twice; the later (restated) filing wins
+                "Assets": concept(("2023-12-31", 900), ("2024-03-31", 1000), ("2024-03-31", 1100)),
+                "AssetsCurrent": concept(("2023-12-31", 350), ("2024-03-31", 400)),
+                "LiabilitiesCurrent": concept(("2023-12-31", 180), ("2024-03-31", 200)),
+                "RetainedEarningsAccumulatedDeficit": concept(("2023-12-31", 250), ("2024-03-31", 300)),
+                "Liabilities": concept(("2023-12-31", 450), ("2024-03-31", 500)),
+                "Revenues": concept(("2023-12-31", 700), ("2024-03-31", 800)),
+            }
+        }
+    }
+
+    class FakeClient:
+        def lookup_cik(self, ticker):
+            return "0000000001"
+
+        def get_company_facts(self, cik):
+            return facts
+
+    class FakeAIClient:
+        def suggest_field_mapping(self, raw_fields, fields, sample_values):
+            return {
+                "total_assets": "Assets",
+                "current_assets": "AssetsCurrent",
+                "current_liabilities": {"FoundField": "LiabilitiesCurrent"},
+                "retained_earnings": "RetainedEarningsAccumulatedDeficit",
+                "total_liabilities": "Liabilities",
+                # Two fields on one concept, one of them with different casing
+                "sales": "Revenues",
+                "ebit": "revenues",
+            }
+
+    monkeypatch.setattr(sec_client, "SECClient", FakeClient)
+    monkeypatch.setattr(financials, "AzureOpenAIClient", FakeAIClient)
+    result = financials.fetch_financials("SEC", "2024-03-31", "original")
+    older, latest = result["quarters"]
+    assert (older["period_end"], latest["period_end"]) == ("2023-12-31", "2024-03-31")
+    assert (older["total_assets"], latest["total_assets"]) == (900.0, 1100.0)
+    assert (older["current_liabilities"], latest["retained_earnings"], latest["total_liabilities"]) == (180.0, 300.0, 500.0)
+    assert (older["sales"], older["ebit"], latest["sales"], latest["ebit"]) == (700.0, 700.0, 800.0, 800.0)
+    assert latest["field_mapping"]["ebit"] == latest["field_mapping"]["sales"] == "Revenues"
+    assert result["missing_fields_by_quarter"] == [[], []]
+
+
+def test_fetch_financials_batch_keeps_ticker_order_and_isolates_failures(monkeypatch):
+    import time
+    from altman_zscore.data_fetching import financials
+    calls = []
+
+    def fake_fetch_financials(ticker, end_date, zscore_model, start_date=None, output_format="json"):
+        calls.append((ticker, end_date, zscore_model, start_date, output_format))
+        # Earlier tickers finish last, so results cannot simply follow completion order
+        time.sleep({"AAA": 0.05, "BAD": 0.02}.get(ticker, 0))
+        if ticker == "BAD":
+            raise RuntimeError("SEC EDGAR unavailable")
+        return {"quarters": [{"ticker": ticker}]}
+
+    monkeypatch.setattr(financials, "fetch_financials", fake_fetch_financials)
+    results = financials.fetch_financials_batch(["AAA", "BAD", "CCC"], "2024-03-31", "original", max_workers=3)
+    assert list(results) == ["AAA", "BAD", "CCC"]
+    assert results["BAD"] is None
+    assert results["AAA"] == {"quarters": [{"ticker": "AAA"}]} and results["CCC"] == {"quarters": [{"ticker": "CCC"}]}
+    assert sorted(calls) == [(t, "2024-03-31", "original", None, "ndjson") for t in ("AAA", "BAD", "CCC")]
+    assert financials.fetch_financials_batch([], "2024-03-31", "original") == {}
+
+
+def test_fetch_and_reconcile_financials_keeps_raw_artifacts_when_later_steps_fail(tmp_path, monkeypatch):
+    import json
+    from altman_zscore.api import sec_client
+    from altman_zscore.data_fetching import financials
+    monkeypatch.chdir(tmp_path)
+
+    class FakeClient:
+        def lookup_cik(self, ticker):
+            return "0000000001"
+
+        def get_company_facts(self, cik):
+            return {"cik": cik, "facts": []}  # malformed facts make the filtering step raise
+
+    monkeypatch.setattr(sec_client, "SECClient", FakeClient)
+    monkeypatch.setattr(financials, "fetch_yfinance_full", lambda ticker: {"info": {"symbol": ticker}})
+    with pytest.raises(AttributeError):
+        financials.fetch_and_reconcile_financials("RAW", "2024-03-31", "original")
+    out = tmp_path / "output" / "RAW"
+    assert json.loads((out / "sec_facts_raw.json").read_text(encoding="utf-8"))["cik"] == "0000000001"
+    assert json.loads((out / "yahoo_raw.json").read_text(encoding="utf-8")) == {"info": {"symbol": "RAW"}}
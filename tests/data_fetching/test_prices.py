@@ -0,0 +1,441 @@
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+
+def test_cached_decorator_serves_repeat_calls_from_disk(tmp_path, monkeypatch):
+    from altman_zscore.utils.cache import cached
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    @cached(namespace="test", ttl=timedelta(days=1))
+    def fetch(ticker, start, end):
+        calls.append((ticker, start, end))
+        return pd.DataFrame({"Close": [1.0, 2.0]})
+
+    first = fetch("abc", "2024-01-01", "2024-01-31")
+    second = fetch("abc", "2024-01-01", "2024-01-31")
+    pd.testing.assert_frame_equal(first, second)
+    assert len(calls) == 1
+    fetch("abc", "2024-01-01", "2024-01-31", force_refresh=True)
+    assert len(calls) == 2
+
+
+def test_gather_market_values_skips_failures(monkeypatch):
+    from altman_zscore.data_fetching import prices
+
+    def fake_market_value(ticker, date):
+        if ticker == "BAD":
+            raise ValueError("no data")
+        return 100.0
+
+    monkeypatch.setattr(prices, "get_market_value", fake_market_value)
+    assert prices.gather_market_values(["AAA", "BAD", "CCC"], "2024-03-29") == {"AAA": 100.0, "CCC": 100.0}
+
+
+def test_get_closest_price_picks_nearest_bar():
+    from altman_zscore.data_fetching.prices import get_closest_price
+    index = pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-05", "2024-01-10"])
+    df = pd.DataFrame({"Close": [1.0, 2.0, 3.0, 4.0]}, index=index)
+    assert get_closest_price(df, "2023-12-01") == 1.0
+    assert get_closest_price(df, "2024-01-06") == 3.0
+    assert get_closest_price(df, "2024-01-09") == 4.0
+    assert get_closest_price(df, "2024-02-01") == 4.0
+
+
+def test_get_start_end_prices_flattens_multiindex_columns(monkeypatch):
+    from altman_zscore.data_fetching import prices
+    columns = pd.MultiIndex.from_tuples([("Close", "ABC"), ("Volume", "ABC")])
+    df = pd.DataFrame([[10.0, 1], [12.5, 2]], columns=columns, index=pd.to_datetime(["2024-01-02", "2024-01-03"]))
+    monkeypatch.setattr(prices, "_yf_download", lambda ticker, start, end, **kwargs: df)
+    assert prices.get_start_end_prices("ABC", "2024-01-01", "2024-01-04") == (10.0, 12.5)
+
+
+def test_get_return_uses_first_and_last_close(monkeypatch):
+    from altman_zscore.data_fetching import prices
+    df = pd.DataFrame({"Close": [10.0, 9.0, 12.5]}, index=pd.bdate_range("2024-01-02", periods=3))
+    # An empty first download is retried after a backoff, as in download_prices
+    results = [pd.DataFrame(), df]
+    monkeypatch.setattr(prices, "_yf_download", lambda ticker, start, end, **kwargs: results.pop(0))
+    monkeypatch.setattr(prices.time, "sleep", lambda seconds: None)
+    assert prices.get_return("ABC", "2024-01-01", "2024-01-05") == pytest.approx(0.25)
+    assert results == []
+    with pytest.raises(ValueError):
+        prices.get_return("ABC", "2024-01-01", "2024-01-05", df=df.iloc[0:0])
+
+
+def test_get_weekly_price_stats_bins_monday_weeks_and_skips_empty(tmp_path, monkeypatch):
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    index = pd.bdate_range("2024-01-01", "2024-01-26").delete(range(5, 10))
+    df = pd.DataFrame({"Close": [float(i) for i in range(len(index))]}, index=index)
+    downloads = []
+    monkeypatch.setattr(prices, "_yf_download", lambda ticker, start, end, **kwargs: downloads.append(ticker) or df)
+    stats = prices.get_weekly_price_stats("ABC", "2024-01-01", "2024-01-26")
+    assert list(stats.columns) == ["week", "avg_price", "min_price", "max_price", "days_with_data"]
+    assert [str(w) for w in stats["week"]] == ["2024-01-01", "2024-01-15", "2024-01-22"]
+    assert stats["avg_price"].tolist() == [2.0, 7.0, 12.0]
+    assert stats["days_with_data"].tolist() == [5, 5, 5]
+    cached = prices.get_weekly_price_stats("ABC", "2024-01-01", "2024-01-26")
+    pd.testing.assert_frame_equal(stats, cached)
+    assert len(downloads) == 1
+
+
+def test_get_weekly_price_stats_with_prices_skips_the_cache(tmp_path, monkeypatch):
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    index = pd.bdate_range("2024-01-01", "2024-01-12")
+    downloaded = pd.DataFrame({"Close": [1.0] * len(index)}, index=index)
+    supplied = pd.DataFrame({"Close": [2.0] * len(index)}, index=index)
+    monkeypatch.setattr(prices, "_yf_download", lambda ticker, start, end, **kwargs: downloaded)
+    assert prices.get_weekly_price_stats("ABC", "2024-01-01", "2024-01-12")["avg_price"].tolist() == [1.0, 1.0]
+    stats = prices.get_weekly_price_stats("ABC", "2024-01-01", "2024-01-12", prices=supplied)
+    assert stats["avg_price"].tolist() == [2.0, 2.0]
+    assert prices.get_weekly_price_stats("ABC", "2024-01-01", "2024-01-12")["avg_price"].tolist() == [1.0, 1.0]
+
+
+def test_get_market_data_with_fallback_uses_stooq_when_yfinance_fails(monkeypatch):
+    from altman_zscore.data_fetching import prices
+
+    class FakeResponse:
+        text = "Date,Open,High,Low,Close,Volume\n2024-03-28,10,11,9,10.5,1000\n"
+
+        def raise_for_status(self):
+            pass
+
+    class FakeSession:
+        def get(self, url, params=None, timeout=None):
+            assert params["s"] == "abc.us"
+            return FakeResponse()
+
+    def failing_market_data(ticker, date, days_buffer=5):
+        raise ValueError("rate limited")
+
+    monkeypatch.setattr(prices, "get_market_data", failing_market_data)
+    monkeypatch.setattr(prices, "_get_stooq_session", lambda: FakeSession())
+    df = prices.get_market_data_with_fallback("ABC", "2024-03-29")
+    assert df._source == "stooq"
+    assert prices.get_closest_price(df, "2024-03-29") == 10.5
+
+
+def test_download_prices_backs_off_on_empty_results(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    df = pd.DataFrame({"Close": [10.0]}, index=pd.to_datetime(["2024-03-28"]))
+    # yf.download reports rate limits as empty frames rather than raising
+    results = [pd.DataFrame(), pd.DataFrame(), df]
+    sleeps = []
+    monkeypatch.setattr(prices, "_yf", lambda: SimpleNamespace(download=lambda *a, **k: results.pop(0)))
+    monkeypatch.setattr(prices.time, "sleep", sleeps.append)
+    pd.testing.assert_frame_equal(prices.download_prices("ABC", "2024-03-25", "2024-04-01"), df)
+    assert len(sleeps) == 2 and 0.5 <= sleeps[0] <= 1.0 and 1.0 <= sleeps[1] <= 2.0
+
+
+def test_get_market_value_prefers_fast_info_market_cap(monkeypatch):
+    from types import SimpleNamespace
+    from altman_zscore.data_fetching import prices
+
+    class FakeTicker:
+        fast_info = SimpleNamespace(market_cap=1_000.0, last_price=20.0)
+
+        @property
+        def quarterly_balance_sheet(self):
+            raise AssertionError("balance sheet should not be fetched")
+
+    df = pd.DataFrame({"Close": [10.0, 11.0]}, index=pd.to_datetime(["2024-03-28", "2024-03-29"]))
+    monkeypatch.setattr(prices, "_yf_ticker", lambda ticker: FakeTicker())
+    monkeypatch.setattr(prices, "get_market_data", lambda ticker, date: df)
+    prices.clear_caches()
+    assert prices.get_market_value("ABC", "2024-03-29") == 550.0
+    assert prices._fast_info_dict("ABC")["market_cap"] == 1_000.0
+    prices.clear_caches()
+
+
+def test_get_market_data_batch_chunks_requests_and_feeds_prefetched_frames(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(prices, "YF_BATCH_SIZE", 2)
+    index = pd.to_datetime(["2024-01-02", "2024-01-03"])
+    requests_made = []
+
+    def fake_download(symbols, **kwargs):
+        chunk = symbols.split()
+        requests_made.append(chunk)
+        columns = pd.MultiIndex.from_tuples([(t, "Close") for t in chunk])
+        return pd.DataFrame([[10.0] * len(chunk), [11.0] * len(chunk)], index=index, columns=columns)
+
+    monkeypatch.setattr(prices, "_yf", lambda: SimpleNamespace(download=fake_download))
+    frames = prices.get_market_data_batch(["AAA", "BBB", "CCC"], "2024-01-01", "2024-01-04")
+    assert requests_made == [["AAA", "BBB"], ["CCC"]]
+    assert set(frames) == {"AAA", "BBB", "CCC"}
+    assert prices.get_start_end_prices("CCC", "2024-01-01", "2024-01-04", df=frames["CCC"]) == (10.0, 11.0)
+
+
+def test_yf_download_returns_single_level_columns(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_download(ticker, **kwargs):
+        calls.append(kwargs)
+        columns = pd.MultiIndex.from_tuples([("Close", ticker), ("Volume", ticker)])
+        return pd.DataFrame([[10.0, 1]], index=pd.to_datetime(["2024-01-02"]), columns=columns)
+
+    monkeypatch.setattr(prices, "_yf", lambda: SimpleNamespace(download=fake_download))
+    df = prices._yf_download("ABC", "2024-01-01", "2024-01-03", force_refresh=True)
+    assert list(df.columns) == ["Close", "Volume"]
+    assert calls[0]["group_by"] == "column" and "multi_level_index" not in calls[0]
+
+
+def test_file_cache_serves_memory_hits_and_purges_expired_entries(tmp_path, monkeypatch):
+    import os
+    from altman_zscore.utils.cache import FileCache
+    monkeypatch.chdir(tmp_path)
+    cache = FileCache("memtest", timedelta(days=1))
+    df = pd.DataFrame({"Close": [1.0]})
+    cache.set("abc", "fresh", df)
+    cache.set("abc", "stale", df, ttl=timedelta(seconds=-1))
+    data_path = os.path.join(tmp_path, "output", ".cache", "memtest", "ABC", "fresh.pkl")
+    os.remove(data_path)
+    hit = cache.get("abc", "fresh")
+    pd.testing.assert_frame_equal(hit, df)
+    # Memory hits are shallow copies, so reshaping one leaves the cached entry intact
+    hit["Volume"] = 1
+    assert list(cache.get("abc", "fresh").columns) == ["Close"]
+    # The first lookup purged the expired entry from disk
+    assert not os.path.exists(os.path.join(tmp_path, "output", ".cache", "memtest", "ABC", "stale.json"))
+    assert cache.get("abc", "stale") is None
+
+
+def test_parquet_request_falls_back_to_csv_without_engine(tmp_path, monkeypatch):
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(prices, "_parquet_available", lambda: False)
+    df = pd.DataFrame({"week": ["2024-01-01"], "avg_price": [1.5]})
+    data_path, _ = prices.save_price_data_to_disk(df, "ABC", "weekly_prices", fmt="parquet")
+    assert data_path.endswith("weekly_prices.csv")
+    pd.testing.assert_frame_equal(prices.load_price_data_from_disk("ABC", "weekly_prices"), df)
+
+
+def test_get_quarter_price_change_uses_one_window_spanning_both_dates(monkeypatch):
+    from altman_zscore.data_fetching import prices
+    index = pd.bdate_range("2023-12-20", "2024-04-10")
+    df = pd.DataFrame({"Close": [100.0 + i for i in range(len(index))]}, index=index)
+    windows = []
+    monkeypatch.setattr(prices, "_yf_download", lambda ticker, start, end, **kwargs: windows.append((start, end)) or df)
+    change = prices.get_quarter_price_change("QPC", "2024-01-01", "2024-03-31")
+    assert windows == [("2023-12-19", "2024-04-07")]
+    start_price = df.loc["2023-12-29", "Close"]
+    end_price = df.loc["2024-03-28", "Close"]
+    assert change == (end_price - start_price) / start_price * 100
+
+
+def test_last_business_day_rolls_weekends_and_holidays_back():
+    from altman_zscore.data_fetching.prices import get_last_business_day, get_last_business_days
+    assert get_last_business_day("2024-03-30") == "2024-03-28"  # Good Friday
+    assert get_last_business_day("2024-04-01") == "2024-04-01"
+    assert get_last_business_day("2024-07-04") == "2024-07-03"
+    assert get_last_business_day("2024-10-14") == "2024-10-14"  # Columbus Day, market open
+    assert get_last_business_days(["2024-06-30", "2024-09-30"]).tolist() == ["2024-06-28", "2024-09-30"]
+    from altman_zscore.market.fetch_prices import get_last_business_day as legacy_last_business_day
+    assert legacy_last_business_day("2024-03-30") == "2024-03-28"
+
+
+def test_close_series_handles_both_multiindex_layouts():
+    from altman_zscore.data_fetching.prices import close_series
+    index = pd.to_datetime(["2024-01-02"])
+    by_field = pd.DataFrame([[1.0, 2.0]], index=index, columns=pd.MultiIndex.from_tuples([("Close", "A"), ("Adj Close", "A")]))
+    by_ticker = pd.DataFrame([[3.0, 4.0]], index=index, columns=pd.MultiIndex.from_tuples([("A", "Open"), ("A", "Close")]))
+    assert close_series(by_field).iat[0] == 2.0
+    assert close_series(by_ticker).iat[0] == 4.0
+    with pytest.raises(ValueError):
+        close_series(pd.DataFrame({"Open": [1.0]}))
+
+
+def test_get_market_value_uses_shares_before_balance_sheet(monkeypatch):
+    from altman_zscore.data_fetching import prices
+    df = pd.DataFrame({"Close": [10.0, 11.0]}, index=pd.to_datetime(["2024-03-28", "2024-03-29"]))
+    monkeypatch.setattr(prices, "_fast_info_dict", lambda ticker: {"shares": 100.0})
+    monkeypatch.setattr(prices, "_yf_ticker", lambda ticker: pytest.fail("balance sheet should not be fetched"))
+    monkeypatch.setattr(prices, "get_market_data", lambda ticker, date: df)
+    assert prices.get_market_value("ABC", "2024-03-29") == 1_100.0
+
+
+def test_batch_weekly_stats_aggregates_in_process_pool_and_caches(tmp_path, monkeypatch):
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(prices, "WEEKLY_STATS_PROCESS_MIN", 1)
+    index = pd.bdate_range("2024-01-01", "2024-01-12")
+    frames = {
+        "AAA": pd.DataFrame({"Close": [float(i) for i in range(len(index))]}, index=index),
+        "BBB": pd.DataFrame({"Volume": [1] * len(index)}, index=index),
+    }
+    calls = []
+
+    def fake_batch(tickers, start, end):
+        calls.append(list(tickers))
+        return {t: frames[t] for t in tickers}
+
+    monkeypatch.setattr(prices, "get_market_data_batch", fake_batch)
+    stats = prices.batch_weekly_stats(["aaa", "BBB"], "2024-01-01", "2024-01-12", workers=2)
+    assert set(stats) == {"AAA"}
+    assert stats["AAA"]["avg_price"].tolist() == [2.0, 7.0]
+    assert prices.batch_weekly_stats(["AAA"], "2024-01-01", "2024-01-12")["AAA"].equals(stats["AAA"])
+    assert calls == [["AAA", "BBB"]]
+
+
+def test_price_store_coalesces_overlapping_windows(monkeypatch):
+    from altman_zscore.data_fetching import prices
+    index = pd.bdate_range("2023-12-01", "2024-07-31")
+    df = pd.DataFrame({"Close": [100.0 + i for i in range(len(index))]}, index=index)
+    windows = []
+
+    def fake_download(ticker, start, end, **kwargs):
+        windows.append((start, end))
+        return df.loc[start:end]
+
+    monkeypatch.setattr(prices, "_yf_download", fake_download)
+    store = prices.PriceStore()
+    for start, end in [("2024-01-01", "2024-03-31"), ("2024-04-01", "2024-06-30")]:
+        store.schedule_quarter_price_change("qpc", start, end)
+        store.schedule_market_value("QPC", end)
+    assert store.materialize() == 1
+    assert windows == [("2023-12-19", "2024-07-08")]
+    change = prices.get_quarter_price_change("QPC", "2024-04-01", "2024-06-30", store=store)
+    assert change == (df.loc["2024-06-28", "Close"] - df.loc["2024-04-01", "Close"]) / df.loc["2024-04-01", "Close"] * 100
+    assert store.slice("QPC", "2024-03-25", "2024-04-02").index[-1] == pd.Timestamp("2024-04-01")
+    assert store.slice("QPC", "2024-07-01", "2024-08-01") is None
+    assert len(windows) == 1
+
+
+def test_get_quarterly_prices_uses_one_download_and_nearest_bars(monkeypatch):
+    from altman_zscore.data_fetching import prices
+    index = pd.bdate_range("2023-12-01", "2024-07-31")
+    df = pd.DataFrame({"Close": [100.0 + i for i in range(len(index))]}, index=index)
+    windows = []
+    monkeypatch.setattr(prices, "_yf_download", lambda ticker, start, end, **kwargs: windows.append((start, end)) or df)
+    result = prices.get_quarterly_prices("QP", ["2024-06-30", "2023-12-31 00:00:00", pd.Timestamp("2024-03-29")])
+    assert windows == [("2023-12-21", "2024-07-10")]
+    assert result["quarter_end"].tolist() == ["2024-06-30", "2023-12-31", "2024-03-29"]
+    assert result["price_date"].tolist() == ["2024-07-01", "2024-01-01", "2024-03-29"]
+    assert result["price"].tolist() == [df.loc["2024-07-01", "Close"], df.loc["2024-01-01", "Close"], df.loc["2024-03-29", "Close"]]
+
+
+def test_recent_price_windows_get_short_cache_ttl(tmp_path, monkeypatch):
+    import json
+    from types import SimpleNamespace
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    df = pd.DataFrame({"Close": [1.0]}, index=pd.to_datetime(["2024-01-02"]))
+    monkeypatch.setattr(prices, "_yf", lambda: SimpleNamespace(download=lambda *a, **k: df))
+    today = pd.Timestamp.today().normalize()
+    recent_end = today.strftime("%Y-%m-%d")
+    prices._yf_download("TTL", "2024-01-01", "2024-01-03", force_refresh=True)
+    prices._yf_download("TTL", (today - timedelta(days=5)).strftime("%Y-%m-%d"), recent_end, force_refresh=True)
+    ttls = sorted(json.loads(p.read_text())["ttl_seconds"] for p in (tmp_path / "output" / ".cache" / "prices" / "TTL").glob("*.json"))
+    assert ttls == [prices.PRICE_RECENT_CACHE_TTL.total_seconds(), prices.PRICE_CACHE_TTL.total_seconds()]
+
+
+def test_get_monthly_price_stats_bins_calendar_months():
+    from datetime import date
+    from altman_zscore.data_fetching.prices import get_monthly_price_stats
+    index = pd.bdate_range("2024-01-29", "2024-03-08").delete(range(4, 19))
+    df = pd.DataFrame({"Close": [float(i) for i in range(len(index))]}, index=index)
+    stats = get_monthly_price_stats("ABC", "2024-01-29", "2024-03-08", prices=df)
+    assert stats["month"].tolist() == [date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)]
+    assert stats["days_with_data"].tolist() == [3, 6, 6]
+    assert stats.loc[0, "avg_price"] == 1.0 and stats.loc[2, "max_price"] == float(len(index) - 1)
+
+
+def test_save_price_data_formats_dates_without_touching_input(tmp_path, monkeypatch):
+    import json
+    from pathlib import Path
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    df = pd.DataFrame({"week": pd.to_datetime(["2024-01-01", "2024-01-08"]), "avg_price": [1.5, 2.5]})
+    csv_path, json_path = prices.save_price_data_to_disk(df, "ABC", "weekly_prices")
+    assert pd.api.types.is_datetime64_any_dtype(df["week"])
+    assert Path(csv_path).read_text(encoding="utf-8").splitlines()[1] == "2024-01-01,1.5"
+    assert json.loads(Path(json_path).read_text(encoding="utf-8"))[0] == {"week": "2024-01-01", "avg_price": 1.5}
+
+
+def test_get_closest_price_handles_tz_aware_index():
+    from altman_zscore.data_fetching.prices import get_closest_price
+    index = pd.to_datetime(["2024-01-02", "2024-01-05"]).tz_localize("America/New_York")
+    df = pd.DataFrame({"Close": [1.0, 2.0]}, index=index)
+    assert get_closest_price(df, "2024-01-03") == 1.0
+    assert get_closest_price(df, "2024-01-04") == 2.0
+
+
+def test_market_cap_on_date_prefers_last_bar_on_or_before_date(monkeypatch):
+    import datetime
+    from altman_zscore.api import yahoo_client
+    index = pd.to_datetime(["2024-03-27", "2024-03-28", "2024-04-01"]).tz_localize("America/New_York")
+    hist = pd.DataFrame({"Close": [1.0, 2.0, 3.0]}, index=index)
+
+    class FakeTicker:
+        info = {"sharesOutstanding": 10}
+
+        def history(self, **kwargs):
+            return hist
+
+    monkeypatch.setattr(yahoo_client.yf, "Ticker", lambda ticker: FakeTicker())
+    client = yahoo_client.YahooFinanceClient()
+    assert client.get_market_cap_on_date("ABC", datetime.date(2024, 3, 31)) == (20.0, datetime.date(2024, 3, 28))
+    assert client.get_market_cap_on_date("ABC", datetime.date(2024, 3, 1)) == (10.0, datetime.date(2024, 3, 27))
+
+
+def test_market_cap_on_date_uses_fast_info_shares_before_info(monkeypatch):
+    import datetime
+    from types import SimpleNamespace
+    from altman_zscore.api import yahoo_client
+    hist = pd.DataFrame({"Close": [2.0]}, index=pd.to_datetime(["2024-03-28"]))
+
+    class FakeTicker:
+        fast_info = SimpleNamespace(shares=5)
+
+        @property
+        def info(self):
+            raise AssertionError("info should not be fetched when fast_info has shares")
+
+        def history(self, **kwargs):
+            return hist
+
+    monkeypatch.setattr(yahoo_client.yf, "Ticker", lambda ticker: FakeTicker())
+    client = yahoo_client.YahooFinanceClient()
+    assert client.get_market_cap_on_date("ABC", datetime.date(2024, 3, 29)) == (10.0, datetime.date(2024, 3, 28))
+
+
+def test_get_market_data_widens_and_backs_off_on_empty_downloads(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    from altman_zscore.data_fetching import prices
+    monkeypatch.chdir(tmp_path)
+    windows, sleeps = [], []
+
+    def empty_download(ticker, start, end, **kwargs):
+        windows.append((start, end))
+        return pd.DataFrame()
+
+    monkeypatch.setattr(prices, "_yf", lambda: SimpleNamespace(download=empty_download))
+    monkeypatch.setattr(prices.time, "sleep", sleeps.append)
+    with pytest.raises(ValueError, match="No market data available for NOPE"):
+        prices.get_market_data("NOPE", "2024-03-28")
+    assert windows == [("2024-03-23", "2024-04-02"), ("2024-03-18", "2024-04-07"), ("2024-03-08", "2024-04-17")]
+    assert len(sleeps) == 2
+
+
+def test_legacy_fetch_prices_shares_the_cached_download_path(monkeypatch):
+    from altman_zscore.data_fetching import prices
+    from altman_zscore.market import fetch_prices
+    df = pd.DataFrame({"Close": [10.0, 12.0]}, index=pd.to_datetime(["2024-03-27", "2024-03-28"]))
+    windows = []
+    monkeypatch.setattr(prices, "_yf_download", lambda ticker, start, end, **kwargs: windows.append((start, end)) or df)
+    assert fetch_prices.get_start_end_prices("ABC", "2024-03-27", "2024-03-29") == (10.0, 12.0)
+    assert fetch_prices.get_market_data("ABC", "2024-03-28") is df
+    assert windows == [("2024-03-27", "2024-03-29"), ("2024-03-23", "2024-04-02")]
+    monkeypatch.setattr(prices, "get_quarter_price_change", lambda ticker, start, end: 5.0)
+    assert fetch_prices.get_quarter_price_change("ABC", "2024-01-01", "2024-03-31") == 5.0
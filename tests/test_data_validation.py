@@ -0,0 +1,79 @@
+from altman_zscore.validation.data_validation import FinancialDataValidator
+
+
+def _as_tuples(issues):
+    return [(i.field, i.issue, i.level, i.value) for i in issues]
+
+
+QUARTERS = [
+    {"total_assets": 100.0, "current_assets": 40.0, "current_liabilities": 30.0,
+     "retained_earnings": 10.0, "ebit": 5.0, "sales": 80.0, "total_liabilities": 50.0},
+    {"total_assets": -5.0, "current_assets": 1.0, "current_liabilities": None,
+     "retained_earnings": 1.0, "ebit": 1.0, "sales": -2.0, "total_liabilities": 100.0},
+    {"total_assets": 0.0, "current_assets": 0.0, "current_liabilities": 0.0,
+     "retained_earnings": 0.0, "ebit": 0.0, "sales": 0.0},
+    {"total_assets": 10.0, "sales": 5.0, "total_liabilities": 200.0},
+    {},
+]
+
+
+def test_validate_many_matches_validate_per_quarter():
+    validator = FinancialDataValidator()
+    bulk = validator.validate_many(QUARTERS)
+    assert [_as_tuples(issues) for issues in bulk] == [_as_tuples(validator.validate(q)) for q in QUARTERS]
+    assert validator.validate_many([]) == []
+
+
+def test_validation_issue_has_no_instance_dict():
+    from altman_zscore.validation.data_validation import ValidationIssue, ValidationLevel
+    issue = ValidationIssue(field="sales", issue="negative", level=ValidationLevel.WARNING, value=-1.0)
+    assert not hasattr(issue, "__dict__")
+    assert (issue.field, issue.value, issue.expected_range) == ("sales", -1.0, None)
+
+
+def test_validate_batch_accepts_dataframe_with_missing_columns():
+    import pandas as pd
+    validator = FinancialDataValidator()
+    frame = pd.DataFrame(
+        {"total_assets": [100.0, -5.0], "sales": [80.0, 1.0], "total_liabilities": [50.0, 1.0]},
+        index=["q1", "q2"],
+    )
+    bulk = validator.validate_batch(frame)
+    assert [_as_tuples(issues) for issues in bulk] == [_as_tuples(validator.validate(q)) for q in frame.to_dict("records")]
+    assert validator.validate_batch(pd.DataFrame()) == []
+
+
+def test_validate_batch_treats_non_numeric_values_as_missing():
+    import pandas as pd
+    validator = FinancialDataValidator()
+    row = dict(QUARTERS[0], ebit="n/a")
+    issues = validator.validate_batch(pd.DataFrame([row, QUARTERS[0]]))
+    assert [[i.field for i in row_issues] for row_issues in issues] == [["ebit"], []]
+
+
+def test_validate_accepts_decimal_values_mixed_with_floats():
+    from decimal import Decimal
+    validator = FinancialDataValidator()
+    q = dict(QUARTERS[0], total_liabilities=Decimal("2000"))
+    issues = validator.validate(q)
+    assert _as_tuples(issues) == _as_tuples(validator.validate(dict(q, total_liabilities=2000.0)))
+    assert [i.field for i in issues] == ["total_liabilities"]
+
+
+def test_summarize_issues_formats_levels_fields_and_values():
+    from altman_zscore.validation.data_validation import ValidationIssue, ValidationLevel
+    validator = FinancialDataValidator()
+    issues = [
+        ValidationIssue(field="ebit", issue="missing", level=ValidationLevel.ERROR),
+        ValidationIssue(field=None, issue="empty", level=ValidationLevel.ERROR),
+        ValidationIssue(field="sales", issue="negative", level=ValidationLevel.WARNING, value=-2.0),
+    ]
+    assert validator.summarize_issues(issues) == "[ERROR] ebit: missing | [ERROR] empty | [WARN] sales: negative (value: -2.0)"
+    assert validator.summarize_issues([]) == "No validation issues."
+
+
+def test_validate_batch_clean_rows_get_separate_empty_lists():
+    import pandas as pd
+    issues = FinancialDataValidator().validate_batch(pd.DataFrame([QUARTERS[0], QUARTERS[0]]))
+    assert issues == [[], []]
+    assert issues[0] is not issues[1]